@@ -6,6 +6,7 @@
 
 import datetime
 import decimal
+import functools
 import json
 import logging
 import re
@@ -17,9 +18,12 @@ from ...base import InstrumentValuesHistoryParser, InstrumentInfoParser, ParseEr
 logging.getLogger().addHandler(logging.NullHandler())
 
 
+@functools.lru_cache(maxsize=256)
 def make_date_from_iso_int(date_as_int: int) -> datetime.date:
     """ Make date from ISO format number
 
+    Results are cached, because many instruments share the same dates.
+
     Example::
 
         d = make_date_from_iso_int(20201231)
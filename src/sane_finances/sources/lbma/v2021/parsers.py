@@ -6,8 +6,10 @@
 
 import datetime
 import decimal
+import functools
 import json
 import logging
+import operator
 import typing
 
 from .meta import (
@@ -17,6 +19,9 @@ from ...base import InstrumentValuesHistoryParser, ParseError, InstrumentInfoPar
 
 logging.getLogger().addHandler(logging.NullHandler())
 
+# list of precious metals is fixed, hence info about them is built only once
+_PRECIOUS_METAL_INFOS = tuple(PreciousMetalInfo(metal=metal) for metal in PreciousMetals)
+
 
 class LbmaInfoParser(InstrumentInfoParser):
     """ Parser for instrument info list from meta-string.
@@ -25,29 +30,31 @@ class LbmaInfoParser(InstrumentInfoParser):
         self.logger = logging.getLogger(__name__ + '.' + self.__class__.__name__)
 
     def parse(self, raw_text: str) -> typing.Iterable[PreciousMetalInfo]:
-        return (PreciousMetalInfo(metal=metal) for metal in PreciousMetals)
+        return iter(_PRECIOUS_METAL_INFOS)
+
 
+@functools.lru_cache(maxsize=4096)
+def _make_decimal(str_value: str) -> decimal.Decimal:
+    # prices repeat often, so reuse already created (immutable) decimals
+    return decimal.Decimal(str_value)
 
-def _extract_field(
-        src_dict: typing.Dict,
-        field_name: str,
-        type_to_check: typing.Optional[typing.Type] = None) -> typing.Any:
-    if field_name not in src_dict:
-        raise ParseError(f"Wrong JSON format. Has no '{field_name}' field.")
 
-    result = src_dict[field_name]
+_REQUIRED_HISTORY_FIELD_NAMES = (HistoryFieldNames.DATE.value, HistoryFieldNames.VALUE.value)
+_REQUIRED_HISTORY_FIELD_NAMES_SET = frozenset(_REQUIRED_HISTORY_FIELD_NAMES)
+_get_required_history_fields = operator.itemgetter(*_REQUIRED_HISTORY_FIELD_NAMES)
 
-    if type_to_check is not None:
-        if not isinstance(result, type_to_check):
-            raise ParseError(f"Wrong JSON format. Field {field_name!r} is not {type_to_check}.")
 
-    return result
+def _raise_missing_field(src_dict: typing.Dict) -> typing.NoReturn:
+    missing_field_names = _REQUIRED_HISTORY_FIELD_NAMES_SET.difference(src_dict)
+    # report the first missing field in the order of declaration
+    field_name = next(name for name in _REQUIRED_HISTORY_FIELD_NAMES if name in missing_field_names)
+    raise ParseError(f"Wrong JSON format. Has no '{field_name}' field.")
 
 
 class LbmaHistoryJsonParser(InstrumentValuesHistoryParser):
     """ Parser for history data of instrument from JSON string.
     """
-    date_format = '%Y-%m-%d'
+    date_format = '%Y-%m-%d'  # only this ISO form is accepted, though dates are parsed with ``date.fromisoformat``
 
     def __init__(self):
         self.logger = logging.getLogger(__name__ + '.' + self.__class__.__name__)
@@ -61,10 +68,13 @@ class LbmaHistoryJsonParser(InstrumentValuesHistoryParser):
         """
         if isinstance(float_value, float):
             str_value = f"{float_value:.2f}"
+        elif isinstance(float_value, int) and not isinstance(float_value, bool):
+            # integers are converted exactly, without string round trip
+            return decimal.Decimal(float_value)
         else:
             str_value = str(float_value)
         try:
-            value = decimal.Decimal(str_value)
+            value = _make_decimal(str_value)
         except decimal.DecimalException as ex:
             raise ParseError(f"Can't convert value {float_value!r} to decimal") from ex
 
@@ -89,23 +99,46 @@ class LbmaHistoryJsonParser(InstrumentValuesHistoryParser):
         if not isinstance(raw_data, list):
             raise ParseError("Wrong JSON format. Top level is not list.")
 
+        value_field_name = HistoryFieldNames.VALUE.value
+        convert_float_to_decimal = self.convert_float_to_decimal
+        # each unique date string is parsed only once
+        dates_cache: typing.Dict[str, datetime.date] = {}
         for item_data in raw_data:
             if not isinstance(item_data, dict):
                 raise ParseError("Wrong JSON format. Data item is not dict.")
 
-            date_str = _extract_field(item_data, HistoryFieldNames.DATE.value)
-            values_data = _extract_field(item_data, HistoryFieldNames.VALUE.value, list)
+            try:
+                date_str, values_data = _get_required_history_fields(item_data)
+            except KeyError:
+                _raise_missing_field(item_data)
+
+            if not isinstance(values_data, list):
+                raise ParseError(f"Wrong JSON format. Field {value_field_name!r} is not {list}.")
+
+            date = dates_cache.get(date_str) if isinstance(date_str, str) else None
+            if date is None:
+                # Python 3.11+ ``fromisoformat`` accepts other ISO forms too (e.g. '20200101'), so check format first
+                if not (isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == date_str[7] == '-'):
+                    raise ParseError(f"Wrong JSON format. Can't create date from {date_str!r}")
+
+                try:
+                    date = datetime.date.fromisoformat(date_str)
+                except (ValueError, TypeError, OverflowError) as ex:
+                    raise ParseError(f"Wrong JSON format. Can't create date from {date_str!r}") from ex
+                dates_cache[date_str] = date
 
             try:
-                date = datetime.datetime.strptime(date_str, self.date_format).date()
-            except (ValueError, TypeError, OverflowError) as ex:
-                raise ParseError(f"Wrong JSON format. Can't create date from {date_str!r}") from ex
+                raw_value = values_data[value_index]
+            except IndexError as ex:
+                raise ParseError(f"Wrong JSON format. Values list has not enough values: {values_data!r}") from ex
 
-            if len(values_data) < value_index + 1:
-                raise ParseError(f"Wrong JSON format. Values list has not enough values: {values_data!r}")
+            if raw_value == 0 and not isinstance(raw_value, bool):
+                # skip empty values without decimal creation
+                continue
 
-            value = self.convert_float_to_decimal(values_data[value_index])
+            value = convert_float_to_decimal(raw_value)
             if value == 0:
+                # value was rounded to zero
                 continue
 
             yield PreciousMetalPrice(date=date, value=value)
@@ -149,6 +149,7 @@ class MoexDynamicEnumTypeManager(DynamicEnumTypeManager):
             Market: ('markets', lambda it: it.identity),
             Board: ('boards', lambda it: it.identity)
         }
+        self._all_managed_types: typing.Tuple[typing.Type, ...] = tuple(self._managed_types)
 
     def is_dynamic_enum_type(self, cls: type) -> bool:
         if not inspect.isclass(cls):
@@ -157,7 +158,7 @@ class MoexDynamicEnumTypeManager(DynamicEnumTypeManager):
         return cls in self._managed_types
 
     def get_all_managed_types(self) -> typing.Iterable[typing.Type]:
-        return self._managed_types.keys()
+        return self._all_managed_types
 
     def get_dynamic_enum_key(self, instance):
         for managed_type, (_, key_getter, *_) in self._managed_types.items():
@@ -194,6 +195,10 @@ class MoexDownloadParameterValuesStorage(MoexDynamicEnumTypeManager, DownloadPar
              "has different managed types.")
 
         self.global_index_data: typing.Optional[GlobalIndexData] = None
+        # enum values by their keys for each managed type;
+        # rebuilt lazily whenever global_index_data is replaced (by reload or directly)
+        self._enum_values_by_key: typing.Dict[typing.Type, typing.Dict[typing.Any, typing.Any]] = {}
+        self._enum_values_by_key_source: typing.Optional[GlobalIndexData] = None
 
     def reload(self) -> None:
         self.downloader.headers = self.headers
@@ -212,6 +217,22 @@ class MoexDownloadParameterValuesStorage(MoexDynamicEnumTypeManager, DownloadPar
         json_string_result.set_correctness(True)
         self.global_index_data = global_index_data
 
+    def _get_enum_values_by_key(self, cls: type) -> typing.Dict[typing.Any, typing.Any]:
+        global_index_data = self.global_index_data
+        if self._enum_values_by_key_source is not global_index_data:
+            enum_values_by_key = {}
+            for managed_type, (global_index_data_attr_name, key_getter, *_) in self._managed_types.items():
+                values_by_key = {}
+                for enum_value in getattr(global_index_data, global_index_data_attr_name):
+                    # first value wins, as in linear search
+                    values_by_key.setdefault(key_getter(enum_value), enum_value)
+                enum_values_by_key[managed_type] = values_by_key
+
+            self._enum_values_by_key = enum_values_by_key
+            self._enum_values_by_key_source = global_index_data
+
+        return self._enum_values_by_key[cls]
+
     def _ensure_loaded(self):
         if self.global_index_data is None:
             self.reload()
@@ -222,14 +243,7 @@ class MoexDownloadParameterValuesStorage(MoexDynamicEnumTypeManager, DownloadPar
 
         self._ensure_loaded()
 
-        global_index_data_attr_name, key_getter, *_ = self._managed_types[cls]
-        enum_values = getattr(self.global_index_data, global_index_data_attr_name)
-
-        for enum_value in enum_values:
-            if key == key_getter(enum_value):
-                return enum_value
-
-        return None
+        return self._get_enum_values_by_key(cls).get(key)
 
     def get_dynamic_enum_value_by_choice(self, cls: type, choice: str) -> typing.Any:
         if not self.is_dynamic_enum_type(cls):
@@ -245,14 +259,7 @@ class MoexDownloadParameterValuesStorage(MoexDynamicEnumTypeManager, DownloadPar
         except (ValueError, TypeError) as ex:
             raise SourceError(f"Can't get enum value key from {choice!r}") from ex
 
-        global_index_data_attr_name, key_getter, *_ = self._managed_types[cls]
-        enum_values = getattr(self.global_index_data, global_index_data_attr_name)
-
-        for enum_value in enum_values:
-            if key == key_getter(enum_value):
-                return enum_value
-
-        return None
+        return self._get_enum_values_by_key(cls).get(key)
 
     def get_all_parameter_values_for(self, cls: type) -> typing.Optional[typing.Iterable]:
         if not self.is_dynamic_enum_type(cls):
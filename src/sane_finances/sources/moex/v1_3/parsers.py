@@ -4,6 +4,7 @@
 """ Utilities for parse data from moex.com.
 """
 import decimal
+import functools
 import json
 import logging
 import typing
@@ -17,12 +18,19 @@ from ...base import (
 logging.getLogger().addHandler(logging.NullHandler())
 
 
-def _parse_block(
+@functools.lru_cache(maxsize=4096, typed=True)
+def _make_decimal(value: typing.Union[str, int]) -> decimal.Decimal:
+    # prices repeat often, so reuse already created (immutable) decimals
+    return decimal.Decimal(value)
+
+
+def _prepare_block(
         block_name: str,
         raw_data: typing.Dict,
         attrs_mapping: typing.Iterable[typing.Tuple[str, str, bool, typing.Any]],
-        raise_when_data_block_is_empty=False) -> typing.Iterable[typing.Dict]:
-
+        raise_when_data_block_is_empty=False) -> typing.Tuple[typing.List, typing.List[typing.Tuple]]:
+    """ Validate block eagerly and get its data with the mapping of attributes to data columns.
+    """
     block = raw_data.get(block_name, None)
     if block is None:
         raise ParseError(f"Wrong JSON format. '{block_name}' block not found.")
@@ -53,6 +61,13 @@ def _parse_block(
         else:
             data_mapping.append((attr_name, converter, column_index))
 
+    return data_block, data_mapping
+
+
+def _iterate_block_data(
+        block_name: str,
+        data_block: typing.List,
+        data_mapping: typing.List[typing.Tuple]) -> typing.Iterable[typing.Dict]:
     for data_item in data_block:
         factory_kwargs = {}
         for attr_name, converter, column_index in data_mapping:
@@ -71,6 +86,15 @@ def _parse_block(
         yield factory_kwargs
 
 
+def _parse_block(
+        block_name: str,
+        raw_data: typing.Dict,
+        attrs_mapping: typing.Iterable[typing.Tuple[str, str, bool, typing.Any]],
+        raise_when_data_block_is_empty=False) -> typing.Iterable[typing.Dict]:
+    data_block, data_mapping = _prepare_block(block_name, raw_data, attrs_mapping, raise_when_data_block_is_empty)
+    return _iterate_block_data(block_name, data_block, data_mapping)
+
+
 class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
     """ Parser for history data of JSON string.
 
@@ -91,8 +115,8 @@ class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
     def __init__(self):
         self.logger = logging.getLogger(__name__ + '.' + self.__class__.__name__)
 
-        self._attrs_mapping = (
-            ('trade_date', 'TRADEDATE', True, self._convert_trade_date_to_date),
+        # mapping of trade date is made in parse, because its converter caches dates per parse
+        self._price_attrs_mapping = (
             ('legal_close_price', 'LEGALCLOSEPRICE', False, self._convert_price_to_decimal),
             ('close', 'CLOSE', False, self._convert_price_to_decimal),
             ('face_value', 'FACEVALUE', False, self._convert_price_to_decimal)
@@ -103,7 +127,15 @@ class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
             raw_json_text: str,
             tzinfo: typing.Optional[datetime.timezone]
     ) -> typing.Iterable[SecurityValue]:
+        # each unique trade date string is parsed only once per parse
+        trade_dates_cache: typing.Dict[str, datetime.date] = {}
+        attrs_mapping = (
+            ('trade_date', 'TRADEDATE', True,
+             functools.partial(self._convert_trade_date_to_date, trade_dates_cache=trade_dates_cache)),
+            *self._price_attrs_mapping
+        )
 
+        # structure of JSON is validated eagerly, i.e. right in this call, not on iteration
         try:
             raw_data = json.loads(raw_json_text)
         except json.decoder.JSONDecodeError as ex:
@@ -113,15 +145,22 @@ class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
             # can be Inf etc., but we accept only {}
             raise ParseError("Wrong JSON format. Top level is not dictionary.")
 
-        for factory_kwargs in _parse_block(
-                'history',
-                raw_data,
-                self._attrs_mapping,
-                raise_when_data_block_is_empty=True):
+        block_name = 'history'
+        data_block, data_mapping = _prepare_block(
+            block_name,
+            raw_data,
+            attrs_mapping,
+            raise_when_data_block_is_empty=True)
+
+        mapped_attr_names = {attr_name for attr_name, *_ in data_mapping}
+        if 'legal_close_price' not in mapped_attr_names and 'close' not in mapped_attr_names:
+            raise ParseError("Wrong JSON format. Neither 'LEGALCLOSEPRICE' nor 'CLOSE' column was found.")
 
-            if 'legal_close_price' not in factory_kwargs and 'close' not in factory_kwargs:
-                raise ParseError("Wrong JSON format. Neither 'LEGALCLOSEPRICE' nor 'CLOSE' column was found.")
+        return self._iterate_values(_iterate_block_data(block_name, data_block, data_mapping))
 
+    @staticmethod
+    def _iterate_values(all_factory_kwargs: typing.Iterable[typing.Dict]) -> typing.Iterable[SecurityValue]:
+        for factory_kwargs in all_factory_kwargs:
             close = factory_kwargs.get('close', None)
             legal_close_price = factory_kwargs.get('legal_close_price', None)
 
@@ -141,15 +180,20 @@ class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
                 factory_kwargs['close'] = close
                 yield SecurityValue(**factory_kwargs)
 
-    def _convert_trade_date_to_date(self, trade_date: str):
+    def _convert_trade_date_to_date(self, trade_date: str, trade_dates_cache: typing.Dict[str, datetime.date]):
+        if isinstance(trade_date, str):
+            cached_date = trade_dates_cache.get(trade_date)
+            if cached_date is not None:
+                return cached_date
+
         try:
-            trade_date = datetime.datetime.strptime(trade_date, self.trade_date_format)
+            date = datetime.datetime.strptime(trade_date, self.trade_date_format).date()
         except (ValueError, TypeError) as ex:
             raise ParseError(f"Wrong JSON format. "
                              f"Can't convert {trade_date!r} to date.") from ex
 
-        trade_date = trade_date.date()
-        return trade_date
+        trade_dates_cache[trade_date] = date
+        return date
 
     @staticmethod
     def _convert_price_to_decimal(price):
@@ -161,7 +205,7 @@ class MoexHistoryJsonParser(InstrumentValuesHistoryParser):
             price = repr(price)
 
         try:
-            decimal_price = decimal.Decimal(price)
+            decimal_price = _make_decimal(price)
         except (ValueError, TypeError, decimal.DecimalException) as ex:
             raise ParseError(f"Wrong JSON format. "
                              f"Can't convert {price!r} to decimal.") from ex
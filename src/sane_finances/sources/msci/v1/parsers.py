@@ -6,6 +6,7 @@
 
 import decimal
 import logging
+import re
 import typing
 from xml.etree import ElementTree
 import datetime
@@ -13,9 +14,13 @@ import datetime
 from .meta import IndexValue, IndexInfo, Styles, Sizes
 from ...base import InstrumentValuesHistoryParser, InstrumentInfoParser, ParseError
 
-
 logging.getLogger().addHandler(logging.NullHandler())
 
+# index ID like 'EAFE,C,36' (name, style and size)
+_INDEX_ID_RE = re.compile(r'([^,]+),([^,]+),([^,]+)')
+# bound once to skip attribute lookups for every history item
+_strptime = datetime.datetime.strptime
+
 
 class MsciHistoryXmlParser(InstrumentValuesHistoryParser):
     """ Parser for history data of index from XML string.
@@ -56,63 +61,77 @@ class MsciHistoryXmlParser(InstrumentValuesHistoryParser):
 
         has_any = False
         for index_element in root.iterfind('./index'):
-            str_id: str = index_element.attrib['id']
-
-            self.logger.debug(f"Got index '{str_id}'")
-
-            index_id_parts = str_id.split(',')
-            if len(index_id_parts) != 3:
-                raise ParseError(f"Wrong XML format. Unexpected index ID: '{str_id}'.")
-
-            index_name, index_style, index_size = index_id_parts
-
-            # see https://github.com/PyCQA/pylint/issues/1801 for pylint disable hint details
-            index_style, index_size = Styles(index_style), Sizes(index_size)  # pylint: disable=no-value-for-parameter
+            index_name, index_style, index_size = self._parse_index_id(index_element)
 
             for data_element in index_element.iterfind('./asOf'):
+                has_any = True
+                yield self._parse_data_element(data_element, index_name, index_style, index_size)
+
+        if not has_any:
+            # empty sequence make no sense: there always must be history
+            raise ParseError("Wrong XML format. Data not found.")
 
-                # get last item
-                date_raw_text = None
-                for date_element in data_element.iterfind('./date'):
-                    date_raw_text = date_element.text
+    def _parse_index_id(self, index_element) -> typing.Tuple[str, Styles, Sizes]:
+        str_id: str = index_element.attrib['id']
 
-                # get last item
-                value_raw_text = None
-                for value in data_element.iterfind('./value'):
-                    value_raw_text = value.text
+        self.logger.debug(f"Got index '{str_id}'")
 
-                self.logger.debug(f"Got {date_raw_text!r} -> {value_raw_text!r}")
+        index_id_match = _INDEX_ID_RE.fullmatch(str_id)
+        if index_id_match is None:
+            raise ParseError(f"Wrong XML format. Unexpected index ID: '{str_id}'.")
 
-                if date_raw_text is None:
-                    raise ParseError(f"Wrong XML format. Not found date tag in\n{ElementTree.tostring(data_element)}")
-                if value_raw_text is None:
-                    raise ParseError(f"Wrong XML format. Not found value tag in\n{ElementTree.tostring(data_element)}")
+        index_name, index_style, index_size = index_id_match.groups()
 
-                try:
-                    value_date = datetime.datetime.strptime(date_raw_text, self.date_format)
-                except (ValueError, TypeError) as ex:
-                    raise ParseError(f"Wrong XML format."
-                                     f"Not valid date: {date_raw_text!r}") from ex
+        # see https://github.com/PyCQA/pylint/issues/1801 for pylint disable hint details
+        return index_name, Styles(index_style), Sizes(index_size)  # pylint: disable=no-value-for-parameter
 
-                value_date = value_date.date()
+    def _parse_data_element(
+            self,
+            data_element,
+            index_name: str,
+            index_style: Styles,
+            index_size: Sizes) -> IndexValue:
+        # get last item
+        date_raw_text = None
+        for date_element in data_element.iterfind('./date'):
+            date_raw_text = date_element.text
+
+        # get last item
+        value_raw_text = None
+        for value in data_element.iterfind('./value'):
+            value_raw_text = value.text
+
+        self.logger.debug(f"Got {date_raw_text!r} -> {value_raw_text!r}")
+
+        if date_raw_text is None:
+            raise ParseError(f"Wrong XML format. Not found date tag in\n{ElementTree.tostring(data_element)}")
+        if value_raw_text is None:
+            raise ParseError(f"Wrong XML format. Not found value tag in\n{ElementTree.tostring(data_element)}")
 
-                try:
-                    value = decimal.Decimal(value_raw_text.replace(',', '').replace(' ', ''))
-                except (ValueError, TypeError, decimal.DecimalException) as ex:
-                    raise ParseError(f"Wrong XML format."
-                                     f"Not valid value: {value_raw_text!r}") from ex
+        try:
+            value_date = _strptime(date_raw_text, self.date_format)
+        except (ValueError, TypeError) as ex:
+            raise ParseError(f"Wrong XML format."
+                             f"Not valid date: {date_raw_text!r}") from ex
 
-                has_any = True
-                yield IndexValue(
-                    date=value_date,
-                    value=value,
-                    index_name=index_name,
-                    style=index_style,
-                    size=index_size)
+        value_date = value_date.date()
 
-        if not has_any:
-            # empty sequence make no sense: there always must be history
-            raise ParseError("Wrong XML format. Data not found.")
+        try:
+            value = decimal.Decimal(value_raw_text.replace(',', '').replace(' ', ''))
+        except (ValueError, TypeError, decimal.DecimalException) as ex:
+            raise ParseError(f"Wrong XML format."
+                             f"Not valid value: {value_raw_text!r}") from ex
+
+        if not value.is_finite():
+            raise ParseError(f"Wrong XML format."
+                             f"Not valid value: {value_raw_text!r}")
+
+        return IndexValue(
+            date=value_date,
+            value=value,
+            index_name=index_name,
+            style=index_style,
+            size=index_size)
 
 
 class MsciIndexInfoParser(InstrumentInfoParser):
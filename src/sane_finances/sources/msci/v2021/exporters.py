@@ -40,6 +40,7 @@ class MsciDynamicEnumTypeManager(DynamicEnumTypeManager):
             Size: ('sizes', lambda it: it.identity),
             Style: ('styles', lambda it: it.identity),
         }
+        self._all_managed_types: typing.Tuple[typing.Type, ...] = tuple(self._managed_types)
 
     def is_dynamic_enum_type(self, cls: type) -> bool:
         if not inspect.isclass(cls):
@@ -48,7 +49,7 @@ class MsciDynamicEnumTypeManager(DynamicEnumTypeManager):
         return cls in self._managed_types
 
     def get_all_managed_types(self) -> typing.Iterable[typing.Type]:
-        return self._managed_types.keys()
+        return self._all_managed_types
 
     def get_dynamic_enum_key(self, instance):
         for managed_type, (_, key_getter, *_) in self._managed_types.items():
@@ -92,6 +93,10 @@ class MsciIndexDownloadParameterValuesStorage(MsciDynamicEnumTypeManager, Downlo
              "has different managed types.")
 
         self.index_panel_data: typing.Optional[IndexPanelData] = None
+        # lazily built per managed type on first lookup;
+        # dropped whenever index_panel_data is replaced (by reload or directly)
+        self._enum_values_by_key: typing.Dict[typing.Type, typing.Dict[typing.Any, typing.Any]] = {}
+        self._enum_values_by_key_source: typing.Optional[IndexPanelData] = None
 
     def reload(self) -> None:
         self.downloader.headers = self.headers
@@ -129,14 +134,21 @@ class MsciIndexDownloadParameterValuesStorage(MsciDynamicEnumTypeManager, Downlo
 
     def _get_dynamic_enum_value_by_key(self, cls: type, key):
         """ """
-        index_panel_data_attr_name, key_getter, *_ = self._managed_types[cls]
-        enum_values = getattr(self.index_panel_data, index_panel_data_attr_name)
+        if self._enum_values_by_key_source is not self.index_panel_data:
+            self._enum_values_by_key = {}
+            self._enum_values_by_key_source = self.index_panel_data
 
-        for enum_value in enum_values:
-            if key == key_getter(enum_value):
-                return enum_value
+        enum_values_by_key = self._enum_values_by_key.get(cls)
+        if enum_values_by_key is None:
+            index_panel_data_attr_name, key_getter, *_ = self._managed_types[cls]
+            enum_values_by_key = {}
+            for enum_value in getattr(self.index_panel_data, index_panel_data_attr_name):
+                # first value wins, as in linear search
+                enum_values_by_key.setdefault(key_getter(enum_value), enum_value)
 
-        return None
+            self._enum_values_by_key[cls] = enum_values_by_key
+
+        return enum_values_by_key.get(key)
 
     def get_dynamic_enum_value_by_key(self, cls: type, key) -> typing.Any:
         if not self.is_dynamic_enum_type(cls):
@@ -8,6 +8,7 @@ import decimal
 import typing
 import datetime
 import enum
+import sys
 import dataclasses
 
 from ...base import (
@@ -66,7 +67,7 @@ class Market(typing.NamedTuple):
 
         # see https://github.com/PyCQA/pylint/issues/1801 for pylint disable hint details
         return cls(
-            identity=str(identity),
+            identity=sys.intern(str(identity)),
             name=str(name),
             scope=None if scope is None else Scopes(scope))  # pylint: disable=no-value-for-parameter
 
@@ -92,7 +93,7 @@ class Currency(typing.NamedTuple):
         :param name: Currency name.
         :return: ``Currency`` instance.
         """
-        return cls(identity=str(identity), name=str(name))
+        return cls(identity=sys.intern(str(identity)), name=str(name))
 
 
 class IndexLevel(typing.NamedTuple):
@@ -132,7 +133,7 @@ class IndexLevel(typing.NamedTuple):
         :param name: Index level name.
         :return: ``IndexLevel`` instance.
         """
-        return cls(identity=str(identity), name=str(name))
+        return cls(identity=sys.intern(str(identity)), name=str(name))
 
 
 class Frequency(typing.NamedTuple):
@@ -153,7 +154,7 @@ class Frequency(typing.NamedTuple):
         :param name: Frequency name.
         :return: ``Frequency`` instance.
         """
-        return cls(identity=str(identity), name=str(name))
+        return cls(identity=sys.intern(str(identity)), name=str(name))
 
 
 class Style(typing.NamedTuple):
@@ -174,7 +175,7 @@ class Style(typing.NamedTuple):
         :param name: Style name.
         :return: ``Style`` instance.
         """
-        return cls(identity=str(identity), name=str(name))
+        return cls(identity=sys.intern(str(identity)), name=str(name))
 
 
 class Size(typing.NamedTuple):
@@ -195,7 +196,7 @@ class Size(typing.NamedTuple):
         :param name: Size name.
         :return: ``Size`` instance.
         """
-        return cls(identity=str(identity), name=str(name))
+        return cls(identity=sys.intern(str(identity)), name=str(name))
 
 
 class IndexSuiteGroup(typing.NamedTuple):
@@ -240,7 +241,7 @@ class IndexSuite(typing.NamedTuple):
         if group is not None and not isinstance(group, IndexSuiteGroup):
             raise TypeError("'group' is not IndexSuiteGroup")
 
-        return cls(identity=str(identity), name=str(name), group=group)
+        return cls(identity=sys.intern(str(identity)), name=str(name), group=group)
 
 
 class IndexPanelData(typing.NamedTuple):
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 import datetime
 import typing
 
@@ -56,17 +58,27 @@ class FakeInstrumentStringDataDownloader(InstrumentStringDataDownloader):
         self.fake_info_string = fake_info_string
         self.fake_history_string = fake_history_string
 
-        self.download_instruments_info_string_results: typing.List[DownloadStringResult] = []
+        # result lists are created on first access
+        self._info_results: typing.Optional[typing.List[DownloadStringResult]] = None
         self.download_instruments_info_string_parameters: typing.List[typing.Any] = []
 
-        self.download_instrument_history_string_results: typing.List[DownloadStringResult] = []
+        self._history_results: typing.Optional[typing.List[DownloadStringResult]] = None
         self.download_instrument_history_string_parameters: typing.List[InstrumentHistoryDownloadParameters] = []
 
-        self.download_instruments_info_string_counter = 0
-        self.download_instrument_history_string_counter = 0
-
         self.download_exception = None
 
+    @property
+    def download_instruments_info_string_results(self) -> typing.List[DownloadStringResult]:
+        if self._info_results is None:
+            self._info_results = []
+        return self._info_results
+
+    @property
+    def download_instrument_history_string_results(self) -> typing.List[DownloadStringResult]:
+        if self._history_results is None:
+            self._history_results = []
+        return self._history_results
+
     def adjust_download_instrument_history_parameters(
             self,
             parameters: InstrumentHistoryDownloadParameters,
@@ -89,7 +101,6 @@ class FakeInstrumentStringDataDownloader(InstrumentStringDataDownloader):
         if self.download_exception is not None:
             raise self.download_exception
 
-        self.download_instruments_info_string_counter += 1
         result = DownloadStringResult(self.fake_info_string)
         self.download_instruments_info_string_results.append(result)
         self.download_instruments_info_string_parameters.append(parameters
@@ -104,7 +115,6 @@ class FakeInstrumentStringDataDownloader(InstrumentStringDataDownloader):
         if self.download_exception is not None:
             raise self.download_exception
 
-        self.download_instrument_history_string_counter += 1
         result = DownloadStringResult(self.fake_history_string)
         self.download_instrument_history_string_results.append(result)
         self.download_instrument_history_string_parameters.append(parameters)
@@ -166,6 +176,13 @@ class FakeDownloadParameterValuesStorage(DownloadParameterValuesStorage):
         """
         self.fake_data = fake_data
 
+        self._all_values = {
+            cls: tuple(enum_value for _, _, enum_value in type_data)
+            for cls, type_data in fake_data.items()}
+        self._choices = {
+            cls: [(enum_choice, enum_value) for _, enum_choice, enum_value in type_data]
+            for cls, type_data in fake_data.items()}
+
     def is_dynamic_enum_type(self, cls: type) -> bool:
         return cls in self.fake_data
 
@@ -201,18 +218,12 @@ class FakeDownloadParameterValuesStorage(DownloadParameterValuesStorage):
         return None
 
     def get_all_parameter_values_for(self, cls: type) -> typing.Optional[typing.Iterable]:
-        if cls not in self.fake_data:
-            return None
-
-        return tuple(enum_value for _, _, enum_value in self.fake_data[cls])
+        return self._all_values.get(cls)
 
     def get_parameter_type_choices(self, cls: type) -> typing.Optional[
                 typing.List[typing.Tuple[typing.Any, typing.Union[str, typing.List[typing.Tuple[typing.Any, str]]]]]
             ]:
-        if cls not in self.fake_data:
-            return None
-
-        return [(enum_choice, enum_value) for _, enum_choice, enum_value in self.fake_data[cls]]
+        return self._choices.get(cls)
 
 
 class FakeInstrumentExporterFactory(InstrumentExporterFactory):
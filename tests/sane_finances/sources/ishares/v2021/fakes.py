@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 import typing
 import datetime
 
@@ -24,7 +26,14 @@ class FakeISharesInfoJsonParser(ISharesInfoJsonParser):
     def __init__(self, fake_data: typing.Iterable[ProductInfo]):
         super().__init__()
 
-        self.fake_data = fake_data
+        self._default_fake_data = tuple(fake_data)
+        self.fake_data = self._default_fake_data
+        self.parse_exception = None
+
+    def reset(self):
+        """ Restore initial fake data and drop parse exception.
+        """
+        self.fake_data = self._default_fake_data
         self.parse_exception = None
 
     def parse(self, raw_json_text: str) -> typing.Iterable[ProductInfo]:
@@ -39,7 +48,14 @@ class FakeISharesHistoryHtmlParser(ISharesHistoryHtmlParser):
     def __init__(self, fake_data: typing.Iterable[PerformanceValue]):
         super().__init__()
 
-        self.fake_data = fake_data
+        self._default_fake_data = tuple(fake_data)
+        self.fake_data = self._default_fake_data
+        self.parse_exception = None
+
+    def reset(self):
+        """ Restore initial fake data and drop parse exception.
+        """
+        self.fake_data = self._default_fake_data
         self.parse_exception = None
 
     def parse(
@@ -63,6 +79,18 @@ class FakeISharesStringDataDownloader(ISharesStringDataDownloader):
         self.fake_history_data = fake_history_data
         self.fake_info_data = fake_info_data
 
+    @property
+    def bad_info_count(self) -> int:
+        """ How many downloaded info strings were marked as incorrect
+        """
+        return sum(1 for result in self.download_instruments_info_string_results if result.is_correct is False)
+
+    @property
+    def bad_history_count(self) -> int:
+        """ How many downloaded history strings were marked as incorrect
+        """
+        return sum(1 for result in self.download_instrument_history_string_results if result.is_correct is False)
+
     def download_history_string(
             self,
             product_page_url: str) -> DownloadStringResult:
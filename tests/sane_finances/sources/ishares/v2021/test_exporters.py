@@ -17,6 +17,8 @@ from .common import CommonTestCases
 from .fakes import (
     FakeDownloader, FakeISharesInfoJsonParser, FakeISharesHistoryHtmlParser, FakeISharesStringDataDownloader)
 
+_EMPTY: tuple = ()
+
 
 class TestISharesDownloadParameterValuesStorage(unittest.TestCase):
 
@@ -37,11 +39,15 @@ class TestISharesDownloadParameterValuesStorage(unittest.TestCase):
 
 class TestISharesStringDataDownloader(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.HISTORY_DOWNLOAD_PARAMS = ISharesInstrumentHistoryDownloadParameters(product_page_url='URL')
+
     def setUp(self):
         self.fake_data = 'data'
         self.string_data_downloader = ISharesStringDataDownloader(FakeDownloader(self.fake_data))
 
-        self.history_download_params = ISharesInstrumentHistoryDownloadParameters(product_page_url='URL')
+        self.history_download_params = self.HISTORY_DOWNLOAD_PARAMS
 
     def test_download_instrument_history_string_Success(self):
         moment_from = datetime.datetime(2010, 1, 1)
@@ -64,8 +70,9 @@ class TestISharesStringDataDownloader(unittest.TestCase):
 
 class TestISharesApiActualityChecker(unittest.TestCase):
 
-    def setUp(self):
-        self.success_info_data = [
+    @classmethod
+    def setUpClass(cls):
+        cls.success_info_data = (
             ProductInfo(
                 local_exchange_ticker=ISharesApiActualityChecker._ticker_to_check,
                 isin='ISIN',
@@ -78,18 +85,23 @@ class TestISharesApiActualityChecker(unittest.TestCase):
                 fund_name='FUND_NAME',
                 inception_date=datetime.date.today(),
                 product_page_url='URL')
-        ]
-        self.info_parser = FakeISharesInfoJsonParser(self.success_info_data)
+        )
+        cls.info_parser = FakeISharesInfoJsonParser(cls.success_info_data)
 
-        self.success_history_data = [
+        cls.success_history_data = (
             PerformanceValue(
                 date=datetime.date.today(),
                 value=decimal.Decimal(42)),
             PerformanceValue(
                 date=ISharesApiActualityChecker._expected_performance_date,
                 value=ISharesApiActualityChecker._expected_value)
-        ]
-        self.history_parser = FakeISharesHistoryHtmlParser(self.success_history_data)
+        )
+        cls.history_parser = FakeISharesHistoryHtmlParser(cls.success_history_data)
+
+    def setUp(self):
+        # parsers are shared by all tests, so restore their state after previous test
+        self.info_parser.reset()
+        self.history_parser.reset()
 
         self.string_data_downloader = FakeISharesStringDataDownloader(None, None)
 
@@ -137,7 +149,7 @@ class TestISharesApiActualityChecker(unittest.TestCase):
 
     def test_check_RaiseWhenNoInfo(self):
         # corrupt data
-        self.info_parser.fake_data = []  # No data
+        self.info_parser.fake_data = _EMPTY  # No data
         checker = self.get_checker()
 
         with self.assertRaisesRegex(CheckApiActualityError, 'Not found instrument'):
@@ -145,6 +157,7 @@ class TestISharesApiActualityChecker(unittest.TestCase):
 
         self.assertGreaterEqual(len(self.string_data_downloader.download_instruments_info_string_results), 1)
         self.assertIs(self.string_data_downloader.download_instruments_info_string_results[-1].is_correct, False)
+        self.assertEqual(self.string_data_downloader.bad_info_count, 1)
 
     def test_check_RaisesWhenHistoryParseError(self):
         # corrupt data
@@ -170,7 +183,7 @@ class TestISharesApiActualityChecker(unittest.TestCase):
 
     def test_check_RaiseWhenNoHistory(self):
         # corrupt data
-        self.history_parser.fake_data = []  # No data
+        self.history_parser.fake_data = _EMPTY  # No data
         checker = self.get_checker()
 
         with self.assertRaisesRegex(CheckApiActualityError, 'Not found expected history value'):
@@ -178,12 +191,18 @@ class TestISharesApiActualityChecker(unittest.TestCase):
 
         self.assertGreaterEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
         self.assertIs(self.string_data_downloader.download_instrument_history_string_results[-1].is_correct, False)
+        self.assertEqual(self.string_data_downloader.bad_history_count, 1)
 
 
 class TestISharesExporterFactory(CommonTestCases.CommonInstrumentExporterFactoryTests):
 
+    @classmethod
+    def setUpClass(cls):
+        # factory has no state except lazy singletons, so share one instance among all tests
+        cls.factory = ISharesExporterFactory()
+
     def get_exporter_factory(self) -> InstrumentExporterFactory:
-        return ISharesExporterFactory()
+        return self.factory
 
     def is_dynamic_enum_type_manager_singleton(self):
         return True
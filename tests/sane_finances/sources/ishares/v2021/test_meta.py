@@ -8,24 +8,29 @@ import unittest
 from sane_finances.sources.base import (
     InstrumentValue, DownloadParametersFactory, InstrumentHistoryDownloadParameters,
     DownloadParameterValuesStorage, InstrumentInfo)
+from sane_finances.sources.ishares.v2021 import meta
 from sane_finances.sources.ishares.v2021.meta import (
     PerformanceValue, ProductInfo, ISharesDownloadParametersFactory,
     ISharesInstrumentInfoDownloadParameters, ISharesInstrumentHistoryDownloadParameters)
 from .common import CommonTestCases
 from .fakes import FakeISharesDownloadParameterValuesStorage
 
+_UTC = datetime.timezone.utc
+_TIME_MIN = datetime.time.min
+_D42 = decimal.Decimal(42)
+
 
 class TestPerformanceValue(unittest.TestCase):
 
     def test_instrument_value_Success(self):
         performance_value = PerformanceValue(
             date=datetime.date(2000, 12, 31),
-            value=decimal.Decimal(42))
+            value=_D42)
         expected_instrument_value = InstrumentValue(
             value=performance_value.value,
-            moment=datetime.datetime.combine(performance_value.date, datetime.time.min, datetime.timezone.utc))
+            moment=datetime.datetime.combine(performance_value.date, _TIME_MIN, _UTC))
 
-        instrument_value = performance_value.get_instrument_value(datetime.timezone.utc)
+        instrument_value = performance_value.get_instrument_value(_UTC)
 
         self.assertEqual(expected_instrument_value, instrument_value)
 
@@ -34,7 +39,7 @@ class TestPerformanceValue(unittest.TestCase):
             # noinspection PyTypeChecker
             _ = PerformanceValue(
                 date=None,
-                value=decimal.Decimal(42))
+                value=_D42)
 
 
 class TestProductInfo(unittest.TestCase):
@@ -105,5 +110,4 @@ class TestISharesDownloadParametersFactory(CommonTestCases.CommonDownloadParamet
 class TestMetaStrAndRepr(CommonTestCases.CommonStrAndReprTests):
 
     def get_testing_module(self):
-        from sane_finances.sources.ishares.v2021 import meta
         return meta
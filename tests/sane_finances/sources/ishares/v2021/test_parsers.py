@@ -1,5 +1,6 @@
 ﻿#!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import collections
 import datetime
 import decimal
 import json
@@ -12,19 +13,42 @@ from sane_finances.sources.ishares.v2021.meta import (ProductInfo, PerformanceVa
 from sane_finances.sources.ishares.v2021.parsers import (
     ISharesHistoryHtmlParser, ISharesInfoJsonParser, make_date_from_iso_int)
 
+_D42 = decimal.Decimal(42)
+_D43 = decimal.Decimal(43)
 
-class TestISharesInfoJsonParser(unittest.TestCase):
+_REQUIRED_INFO_FIELDS = ('localExchangeTicker', 'isin', 'fundName', 'productPageUrl', 'inceptionDate', 'r')
+_FIELD_PATTERNS = {field_name: re.compile(f'"{field_name}"') for field_name in _REQUIRED_INFO_FIELDS}
+_INCEPTION_DICT_RE = re.compile(r'"inceptionDate":\{.*?\}')
 
-    def setUp(self) -> None:
-        self.parser = ISharesInfoJsonParser()
+_DATE_UTC_RE = re.compile(
+    r"Date.UTC\((?P<year>\d*?),(?P<month>\d*?),(?P<day>\d*?)\)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_DATE_RE = re.compile(r"Date.UTC")
+_NUMBER_RE = re.compile(r"Number")
+_NUMBER_VALUE_RE = re.compile(r"Number\(\(.*?\)")
 
-    def check_parse_raise(self, invalid_json: str, message: str):
-        with self.assertRaisesRegex(ParseError, message):
-            _ = list(self.parser.parse(invalid_json))
+_HTML_PREFIX = """<!DOCTYPE html>
+        <html xmlns="http://www.w3.org/1999/xhtml" prefix="og: http://ogp.me/ns#" lang="en" xml:lang="en">
+        <head>
+            <title>iShares Core S&P 500 ETF | IVV</title>
+        </head>
+        <body id="us-ishares">
+            <script nonce="Hdk1jsMIJVe99omXlyZrWA==">
+                //<![CDATA[
+                var yDecimalsNavChart = 2;
+                var yDecimals = 2;
+                var performanceData = ["""
+_HTML_SUFFIX = """];
+                var chartTooltipDateFormat = 'EEE, MMM dd, yyyy';
+                //]]>
+            </script>
+        </body>
+        </html>"""
 
-    # noinspection PyMethodMayBeStatic
-    def get_valid_info_json(self):
-        valid_json = '''{
+
+class TestISharesInfoJsonParser(unittest.TestCase):
+    _VALID_INFO_JSON = '''{
         "239726":
           {
             "fees":{"d":"0.03","r":0.03},
@@ -52,7 +76,16 @@ class TestISharesInfoJsonParser(unittest.TestCase):
             "ter":{"d":"0.18","r":0.18}
           }
         }'''
-        return valid_json
+
+    def setUp(self) -> None:
+        self.parser = ISharesInfoJsonParser()
+
+    def check_parse_raise(self, invalid_json: str, message: str):
+        with self.assertRaisesRegex(ParseError, message):
+            collections.deque(self.parser.parse(invalid_json), maxlen=0)
+
+    def get_valid_info_json(self):
+        return self._VALID_INFO_JSON
 
     def test_parse_Success(self):
         valid_json = self.get_valid_info_json()
@@ -64,14 +97,14 @@ class TestISharesInfoJsonParser(unittest.TestCase):
                 local_exchange_ticker=info_data['localExchangeTicker'],
                 isin=info_data['isin'],
                 fund_name=info_data['fundName'],
-                inception_date=make_date_from_iso_int(int(info_data['inceptionDate']['r'])),
+                inception_date=make_date_from_iso_int(info_data['inceptionDate']['r']),
                 product_page_url=info_data['productPageUrl'])
             for info_data
             in raw_data.values()]
 
         result = list(self.parser.parse(valid_json))
 
-        self.assertSequenceEqual(expected_result, result)
+        self.assertEqual(expected_result, result)
 
     def test_parse_RaiseWhenNoData(self):
         invalid_json = ''
@@ -90,10 +123,9 @@ class TestISharesInfoJsonParser(unittest.TestCase):
 
     def test_parse_RaiseWhenNoRequiredFields(self):
         valid_json = self.get_valid_info_json()
-        for field_to_check in ('localExchangeTicker', 'isin', 'fundName', 'productPageUrl', 'inceptionDate', 'r'):
+        for field_to_check in _REQUIRED_INFO_FIELDS:
             # corrupt JSON
-            pattern_to_corrupt = f'"{field_to_check}"'
-            invalid_json = re.sub(pattern_to_corrupt, f'"__{field_to_check}"', valid_json)
+            invalid_json = _FIELD_PATTERNS[field_to_check].sub(f'"__{field_to_check}"', valid_json)
 
             self.check_parse_raise(invalid_json, f"'{field_to_check}'")
 
@@ -101,9 +133,7 @@ class TestISharesInfoJsonParser(unittest.TestCase):
         valid_json = self.get_valid_info_json()
 
         # corrupt JSON
-        invalid_json = re.sub(r'"inceptionDate":{.*?}',
-                              '"inceptionDate":42',
-                              valid_json)
+        invalid_json = _INCEPTION_DICT_RE.sub('"inceptionDate":42', valid_json)
 
         self.check_parse_raise(invalid_json, "'inceptionDate'")
 
@@ -111,9 +141,7 @@ class TestISharesInfoJsonParser(unittest.TestCase):
         valid_json = self.get_valid_info_json()
 
         # corrupt JSON
-        invalid_json = re.sub(r'"inceptionDate":{.*?}',
-                              '"inceptionDate":{"r":"NOT_INT"}',
-                              valid_json)
+        invalid_json = _INCEPTION_DICT_RE.sub('"inceptionDate":{"r":"NOT_INT"}', valid_json)
 
         self.check_parse_raise(invalid_json, "Can't convert.*?to int")
 
@@ -121,122 +149,97 @@ class TestISharesInfoJsonParser(unittest.TestCase):
         valid_json = self.get_valid_info_json()
 
         # corrupt JSON
-        invalid_json = re.sub(r'"inceptionDate":{.*?}',
-                              '"inceptionDate":{"r":9999999999}',
-                              valid_json)
+        invalid_json = _INCEPTION_DICT_RE.sub('"inceptionDate":{"r":9999999999}', valid_json)
 
         self.check_parse_raise(invalid_json, "Can't create date from")
 
 
 class TestISharesHistoryHtmlParser(unittest.TestCase):
+    _DATE_FORMAT = '%a, %b %d, %Y'
 
     def setUp(self) -> None:
         self.parser = ISharesHistoryHtmlParser()
 
         self.expected_result = [
-            PerformanceValue(date=datetime.date(1999, 12, 31), value=decimal.Decimal(42)),
-            PerformanceValue(date=datetime.date(2000, 1, 1), value=decimal.Decimal(43))
+            PerformanceValue(date=datetime.date(1999, 12, 31), value=_D42),
+            PerformanceValue(date=datetime.date(2000, 1, 1), value=_D43)
         ]
 
     def get_html_to_parse(self):
-        date_format = '%a, %b %d, %Y'
-        perf_data = ",".join([
+        date_format = self._DATE_FORMAT
+        perf_data = ",".join(
             '{'+f'x:Date.UTC({perf_value.date.year},{perf_value.date.month-1},{perf_value.date.day}),'
                 f'y:Number(({perf_value.value}).toFixed(2)),formattedX: "{perf_value.date.strftime(date_format)}"' + '}'
             for perf_value
-            in self.expected_result])
-
-        html = f"""<!DOCTYPE html>
-        <html xmlns="http://www.w3.org/1999/xhtml" prefix="og: http://ogp.me/ns#" lang="en" xml:lang="en">
-        <head>
-            <title>iShares Core S&P 500 ETF | IVV</title>
-        </head>
-        <body id="us-ishares">
-            <script nonce="Hdk1jsMIJVe99omXlyZrWA==">
-                //<![CDATA[
-                var yDecimalsNavChart = 2;
-                var yDecimals = 2;
-                var performanceData = [{perf_data}];
-                var chartTooltipDateFormat = 'EEE, MMM dd, yyyy';
-                //]]>
-            </script>
-        </body>
-        </html>"""
+            in self.expected_result)
 
-        return html
+        # parser accepts only strings, so only the middle part of HTML is built per call
+        return _HTML_PREFIX + perf_data + _HTML_SUFFIX
 
     def test_parse_Success(self):
         html = self.get_html_to_parse()
 
         result = list(self.parser.parse(html, None))
 
-        self.assertSequenceEqual(self.expected_result, result)
+        self.assertEqual(self.expected_result, result)
 
     def test_parse_RaiseWithEmptyString(self):
         html = ""
 
         with self.assertRaisesRegex(ParseError, 'No data found'):
-            _ = list(self.parser.parse(html, None))
+            collections.deque(self.parser.parse(html, None), maxlen=0)
 
     def test_parse_RaiseWithNoData(self):
         self.expected_result = []
         html = self.get_html_to_parse()
 
         with self.assertRaisesRegex(ParseError, 'No data found'):
-            _ = list(self.parser.parse(html, None))
+            collections.deque(self.parser.parse(html, None), maxlen=0)
 
     def test_parse_RaiseWhenWrongDate(self):
         valid_html = self.get_html_to_parse()
         # corrupt HTML
-        bad_html = re.sub(r"Date.UTC", "BAD_DATE", valid_html)
+        bad_html = _DATE_RE.sub("BAD_DATE", valid_html)
 
         with self.assertRaisesRegex(ParseError, "Not found date in HTML"):
-            _ = list(self.parser.parse(bad_html, None))
+            collections.deque(self.parser.parse(bad_html, None), maxlen=0)
 
     def test_parse_RaiseWhenNoNumber(self):
         valid_html = self.get_html_to_parse()
         # corrupt HTML
-        bad_html = re.sub(r"Number", "BAD_VALUE", valid_html)
+        bad_html = _NUMBER_RE.sub("BAD_VALUE", valid_html)
 
         with self.assertRaisesRegex(ParseError, "Not found value in HTML"):
-            _ = list(self.parser.parse(bad_html, None))
+            collections.deque(self.parser.parse(bad_html, None), maxlen=0)
 
     def test_parse_RaiseWhenWrongValue(self):
         valid_html = self.get_html_to_parse()
         # corrupt HTML
-        bad_html = re.sub(r"Number\(\(.*?\)", "Number((WRONG)", valid_html)
+        bad_html = _NUMBER_VALUE_RE.sub("Number((WRONG)", valid_html)
 
         with self.assertRaisesRegex(ParseError, "Can't convert value.*?to decimal"):
-            _ = list(self.parser.parse(bad_html, None))
+            collections.deque(self.parser.parse(bad_html, None), maxlen=0)
 
     def test_parse_RaiseWhenWrongDateParts(self):
         valid_html = self.get_html_to_parse()
         # corrupt HTML
-        search_pattern = re.compile(
-            r"Date.UTC\((?P<year>\d*?),(?P<month>\d*?),(?P<day>\d*?)\)",
-            re.IGNORECASE | re.MULTILINE | re.DOTALL
-        )
         for corrupt_pattern, field_name in (
                 (r"Date.UTC(,\g<month>,\g<day>)", 'year'),
                 (r"Date.UTC(\g<year>,,\g<day>)", 'month'),
                 (r"Date.UTC(\g<year>,\g<month>,)", 'day')):
-            bad_html = re.sub(search_pattern, corrupt_pattern, valid_html)
+            bad_html = _DATE_UTC_RE.sub(corrupt_pattern, valid_html)
 
             with self.assertRaisesRegex(ParseError, f"Can't convert '{field_name}' value.*?to int"):
-                _ = list(self.parser.parse(bad_html, None))
+                collections.deque(self.parser.parse(bad_html, None), maxlen=0)
 
     def test_parse_RaiseWhenWrongDateValue(self):
         valid_html = self.get_html_to_parse()
         # corrupt HTML
-        search_pattern = re.compile(
-            r"Date.UTC\((?P<year>\d*?),(?P<month>\d*?),(?P<day>\d*?)\)",
-            re.IGNORECASE | re.MULTILINE | re.DOTALL
-        )
         for corrupt_pattern in (
                 r"Date.UTC(99999999999,\g<month>,\g<day>)",
                 r"Date.UTC(\g<year>,99999,\g<day>)",
                 r"Date.UTC(\g<year>,\g<month>,99999)"):
-            bad_html = re.sub(search_pattern, corrupt_pattern, valid_html)
+            bad_html = _DATE_UTC_RE.sub(corrupt_pattern, valid_html)
 
             with self.assertRaisesRegex(ParseError, "Can't create date"):
-                _ = list(self.parser.parse(bad_html, None))
+                collections.deque(self.parser.parse(bad_html, None), maxlen=0)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import functools
 import typing
 
 # DO NOT IMPORT HERE ANYTHING FROM sane_finances.sources
@@ -8,6 +9,12 @@ from .common import CommonTestCases
 
 class TestISharesV2021Register(CommonTestCases.CommonSourceRegisterTests):
 
-    def get_source_instrument_exporter_factory(self) -> typing.Type:
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _factory_cls(cls) -> typing.Type:
+        # import only on first call, i.e. after test reads all available exporters
         from sane_finances.sources.ishares.v2021.exporters import ISharesExporterFactory
         return ISharesExporterFactory
+
+    def get_source_instrument_exporter_factory(self) -> typing.Type:
+        return self._factory_cls()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import collections
 import typing
 import datetime
 
@@ -57,8 +58,8 @@ class FakeLbmaStringDataDownloader(LbmaStringDataDownloader):
     def __init__(self, fake_info_data, fake_history_data):
         super().__init__(FakeDownloader(None))
 
-        self.download_instruments_info_string_results: typing.List[DownloadStringResult] = []
-        self.download_instrument_history_string_results: typing.List[DownloadStringResult] = []
+        self.download_instruments_info_string_results: typing.Deque[DownloadStringResult] = collections.deque()
+        self.download_instrument_history_string_results: typing.Deque[DownloadStringResult] = collections.deque()
 
         self.fake_history_data = fake_history_data
         self.fake_info_data = fake_info_data
@@ -17,11 +17,14 @@ from .common import CommonTestCases
 from .fakes import (
     FakeDownloader, FakeLbmaHistoryJsonParser, FakeLbmaStringDataDownloader)
 
+_D42 = decimal.Decimal(42)
+
 
 class TestLbmaDownloadParameterValuesStorage(unittest.TestCase):
 
-    def setUp(self):
-        self.storage = LbmaDownloadParameterValuesStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = LbmaDownloadParameterValuesStorage()
 
     def test_is_dynamic_enum_type_AlwaysFalse(self):
         self.assertFalse(self.storage.is_dynamic_enum_type(HistoryFieldNames))
@@ -41,11 +44,12 @@ class TestLbmaDownloadParameterValuesStorage(unittest.TestCase):
 
 class TestLbmaStringDataDownloader(unittest.TestCase):
 
-    def setUp(self):
-        self.fake_data = 'data'
-        self.string_data_downloader = LbmaStringDataDownloader(FakeDownloader(self.fake_data))
+    @classmethod
+    def setUpClass(cls):
+        cls.fake_data = 'data'
+        cls.string_data_downloader = LbmaStringDataDownloader(FakeDownloader(cls.fake_data))
 
-        self.history_download_params = LbmaPreciousMetalHistoryDownloadParameters(
+        cls.history_download_params = LbmaPreciousMetalHistoryDownloadParameters(
             metal=PreciousMetals.GOLD_AM,
             currency=Currencies.USD)
 
@@ -68,15 +72,21 @@ class TestLbmaStringDataDownloader(unittest.TestCase):
 
 class TestLbmaApiActualityChecker(unittest.TestCase):
 
-    def setUp(self):
-        self.success_history_data = [
+    @classmethod
+    def setUpClass(cls):
+        cls._today = datetime.date.today()
+        # tests never mutate success data, only replace it in parser
+        cls._success_history_data = (
             PreciousMetalPrice(
-                date=datetime.date.today(),
-                value=decimal.Decimal(42)),
+                date=cls._today,
+                value=_D42),
             PreciousMetalPrice(
                 date=LbmaApiActualityChecker._date_to_check,
                 value=LbmaApiActualityChecker._expected_value)
-        ]
+        )
+
+    def setUp(self):
+        self.success_history_data = self._success_history_data
         self.history_parser = FakeLbmaHistoryJsonParser(self.success_history_data)
 
         self.string_data_downloader = FakeLbmaStringDataDownloader(None, None)
@@ -93,9 +103,9 @@ class TestLbmaApiActualityChecker(unittest.TestCase):
         # check that there is no incorrectly downloaded strings
         self.assertGreaterEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertGreaterEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
-        self.assertFalse(any(result.is_correct is False
-                             for result
-                             in self.string_data_downloader.download_instrument_history_string_results))
+        self.assertTrue(all(result.is_correct is not False
+                            for result
+                            in self.string_data_downloader.download_instrument_history_string_results))
 
     def test_check_RaisesWhenHistoryParseError(self):
         # corrupt data
@@ -8,24 +8,29 @@ import unittest
 from sane_finances.sources.base import (
     InstrumentValue, DownloadParametersFactory, InstrumentHistoryDownloadParameters,
     DownloadParameterValuesStorage, InstrumentInfo)
+from sane_finances.sources.lbma.v2021 import meta
 from sane_finances.sources.lbma.v2021.meta import (
     PreciousMetalPrice, PreciousMetalInfo, Currencies, PreciousMetals,
     LbmaDownloadParametersFactory, LbmaPreciousMetalInfoDownloadParameters, LbmaPreciousMetalHistoryDownloadParameters)
 from .common import CommonTestCases
 from .fakes import FakeLbmaDownloadParameterValuesStorage
 
+_UTC = datetime.timezone.utc
+_TIME_MIN = datetime.time.min
+_D42 = decimal.Decimal(42)
+
 
 class TestPreciousMetalPrice(unittest.TestCase):
 
     def test_instrument_value_Success(self):
         metal_price = PreciousMetalPrice(
             date=datetime.date(2000, 12, 31),
-            value=decimal.Decimal(42))
+            value=_D42)
         expected_instrument_value = InstrumentValue(
             value=metal_price.value,
-            moment=datetime.datetime.combine(metal_price.date, datetime.time.min, datetime.timezone.utc))
+            moment=datetime.datetime.combine(metal_price.date, _TIME_MIN, _UTC))
 
-        instrument_value = metal_price.get_instrument_value(datetime.timezone.utc)
+        instrument_value = metal_price.get_instrument_value(_UTC)
 
         self.assertEqual(expected_instrument_value, instrument_value)
 
@@ -34,7 +39,7 @@ class TestPreciousMetalPrice(unittest.TestCase):
             # noinspection PyTypeChecker
             _ = PreciousMetalPrice(
                 date=None,
-                value=decimal.Decimal(42))
+                value=_D42)
 
 
 class TestPreciousMetalInfo(unittest.TestCase):
@@ -108,5 +113,4 @@ class TestLbmaDownloadParametersFactory(CommonTestCases.CommonDownloadParameters
 class TestMetaStrAndRepr(CommonTestCases.CommonStrAndReprTests):
 
     def get_testing_module(self):
-        from sane_finances.sources.lbma.v2021 import meta
         return meta
@@ -3,6 +3,8 @@
 
 import datetime
 import decimal
+import json
+import typing
 import unittest
 
 from sane_finances.sources.base import ParseError
@@ -27,37 +29,55 @@ class TestLbmaInfoParser(unittest.TestCase):
 
 class TestLbmaHistoryJsonParser(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.currency = Currencies.USD
+        cls.default_expected_result = (
+            PreciousMetalPrice(date=datetime.date(1999, 12, 31), value=decimal.Decimal('42.42')),
+            PreciousMetalPrice(date=datetime.date(2000, 1, 1), value=decimal.Decimal('43.43'))
+        )
+        cls.valid_json = cls.make_json(cls.default_expected_result)
+
     def setUp(self) -> None:
         self.parser = LbmaHistoryJsonParser()
-        self.currency = Currencies.USD
         self.parser.download_parameters = LbmaPreciousMetalHistoryDownloadParameters.safe_create(
             metal=PreciousMetals.GOLD_AM,
             currency=self.currency)
 
-        self.expected_result = [
-            PreciousMetalPrice(date=datetime.date(1999, 12, 31), value=decimal.Decimal('42.42')),
-            PreciousMetalPrice(date=datetime.date(2000, 1, 1), value=decimal.Decimal('43.43'))
-        ]
+        self.expected_result = list(self.default_expected_result)
+
+    @classmethod
+    def make_json(cls, prices: typing.Iterable[PreciousMetalPrice]) -> str:
+        value_index = cls.currency.history_position
+        return json.dumps(
+            [{'d': price.date.isoformat(),
+              'v': [float(price.value) if index == value_index else 0 for index in range(len(Currencies))]}
+             for price in prices],
+            separators=(',', ':'))
 
     def get_json_to_parse(self):
-        date_format = '%Y-%m-%d'
-        items = []
-        for price in self.expected_result:
-            date_str = price.date.strftime(date_format)
-            values_str = ','.join(str(price.value if index == self.currency.history_position else 0)
-                                  for index
-                                  in range(len(Currencies)))
+        return self.make_json(self.expected_result)
 
-            items.append('{'+f'"d":"{date_str}","v":[{values_str}]' + '}')
+    def test_convert_float_to_decimal_SuccessWithFloat(self):
+        float_value = 42.42
+        expected_result = decimal.Decimal('42.42')
 
-        json_to_parse = '[' + ",".join(items) + ']'
+        self.assertEqual(expected_result, self.parser.convert_float_to_decimal(float_value))
 
-        return json_to_parse
+    def test_convert_float_to_decimal_SuccessWithInt(self):
+        float_value = 42
+        expected_result = decimal.Decimal('42')
 
-    def test_parse_Success(self):
-        valid_json = self.get_json_to_parse()
+        # noinspection PyTypeChecker
+        self.assertEqual(expected_result, self.parser.convert_float_to_decimal(float_value))
 
-        result = list(self.parser.parse(valid_json, None))
+    def test_convert_float_to_decimal_RaiseWithBool(self):
+        with self.assertRaisesRegex(ParseError, "Can't convert.*?to decimal"):
+            # noinspection PyTypeChecker
+            _ = self.parser.convert_float_to_decimal(True)
+
+    def test_parse_Success(self):
+        result = list(self.parser.parse(self.valid_json, None))
 
         self.assertSequenceEqual(self.expected_result, result)
 
@@ -74,12 +94,36 @@ class TestLbmaHistoryJsonParser(unittest.TestCase):
 
         self.assertSequenceEqual(expected_result, result)
 
+    def test_parse_SuccessWithRoundedToZeroValues(self):
+        valid_json = '[{"d":"1968-01-02","v":[0.001,0.001,0.001]}]'
+
+        result = list(self.parser.parse(valid_json, None))
+
+        self.assertSequenceEqual([], result)
+
+    def test_parse_RaiseWhenValueIsFalse(self):
+        invalid_json = '[{"d":"1968-01-02","v":[false,false,false]}]'
+
+        with self.assertRaisesRegex(ParseError, "Can't convert.*?to decimal"):
+            _ = list(self.parser.parse(invalid_json, None))
+
+    def test_parse_SuccessWithSameDates(self):
+        same_date = self.expected_result[0].date
+        self.expected_result = [
+            PreciousMetalPrice(date=same_date, value=decimal.Decimal('42.42')),
+            PreciousMetalPrice(date=same_date, value=decimal.Decimal('43.43'))
+        ]
+        valid_json = self.get_json_to_parse()
+
+        result = list(self.parser.parse(valid_json, None))
+
+        self.assertSequenceEqual(self.expected_result, result)
+
     def test_parse_RaiseWithNoDownloadParameters(self):
         self.parser.download_parameters = None
-        valid_json = self.get_json_to_parse()
 
         with self.assertRaisesRegex(ParseError, "'download_parameters'"):
-            _ = list(self.parser.parse(valid_json, None))
+            _ = list(self.parser.parse(self.valid_json, None))
 
     def test_parse_RaiseWithEmptyString(self):
         invalid_json = ''
@@ -129,6 +173,20 @@ class TestLbmaHistoryJsonParser(unittest.TestCase):
         with self.assertRaisesRegex(ParseError, "Can't create date from"):
             _ = list(self.parser.parse(invalid_json, None))
 
+    def test_parse_RaiseWhenDateIsNotString(self):
+        invalid_json = '[{"d":19680102,"v":[35.18,14.64,0]}]'
+
+        with self.assertRaisesRegex(ParseError, "Can't create date from"):
+            _ = list(self.parser.parse(invalid_json, None))
+
+    def test_parse_RaiseWhenDateIsNotInDateFormat(self):
+        for date_str in ('19680102', '1968-W01-2', '1968-002'):
+            with self.subTest(date_str=date_str):
+                invalid_json = f'[{{"d":"{date_str}","v":[35.18,14.64,0]}}]'
+
+                with self.assertRaisesRegex(ParseError, "Can't create date from"):
+                    _ = list(self.parser.parse(invalid_json, None))
+
     def test_parse_RaiseWhenWrongValue(self):
         invalid_json = '[{"d":"1968-01-02","v":["WRONG","WRONG","WRONG"]}]'
 
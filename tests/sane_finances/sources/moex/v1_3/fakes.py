@@ -34,6 +34,9 @@ class FakeMoexDownloadParameterValuesStorage(MoexDownloadParameterValuesStorage)
     def __init__(self, fake_global_index_data: GlobalIndexData):
         super().__init__(FakeDownloader(None), FakeMoexGlobalIndexJsonParser(fake_global_index_data))
 
+        # set fake data right away, without fake download round trip
+        self.global_index_data = fake_global_index_data
+
 
 class FakeMoexSecurityInfoJsonParser(MoexSecurityInfoJsonParser):
 
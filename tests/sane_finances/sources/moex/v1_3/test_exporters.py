@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import functools
 import unittest
 import datetime
 import decimal
@@ -79,6 +80,17 @@ class TestMoexDownloadParameterValuesStorage(unittest.TestCase):
             self.downloader,
             self.global_index_json_parser)
 
+    def test_get_dynamic_enum_value_by_key_SeesAssignedGlobalIndexData(self):
+        engine = self.global_index_data.trade_engines[0]
+        self.storage.global_index_data = self.global_index_data
+
+        self.assertEqual(self.storage.get_dynamic_enum_value_by_key(TradeEngine, engine.identity), engine)
+        self.assertEqual(len(self.downloader.download_string_results), 0)  # no reload
+
+        self.storage.global_index_data = self.global_index_data._replace(trade_engines=())
+
+        self.assertIsNone(self.storage.get_dynamic_enum_value_by_key(TradeEngine, engine.identity))
+
     def test_reload_Success(self):
         self.storage.reload()
 
@@ -160,31 +172,36 @@ class TestMoexDownloadParameterValuesStorage(unittest.TestCase):
 
 class TestMoexStringDataDownloader(unittest.TestCase):
 
-    def setUp(self):
-        self.fake_data = 'data'
+    @classmethod
+    def setUpClass(cls):
+        cls.fake_data = 'data'
 
-        self.engine = TradeEngine(
+        cls.engine = TradeEngine(
             identity=42,
             name='stock',
             title='Фондовый рынок и рынок депозитов')
-        self.market = Market(
+        cls.market = Market(
             identity=42,
-            trade_engine=self.engine,
+            trade_engine=cls.engine,
             name='shares',
             title='Рынок акций',
             marketplace='MXSE')
-        self.board = Board(
+        cls.board = Board(
             identity=42,
-            trade_engine=self.engine,
-            market=self.market,
+            trade_engine=cls.engine,
+            market=cls.market,
             boardid='TQTF',
             title='Т+: ETF - безадрес.',
             is_traded=True,
             has_candles=True,
             is_primary=True)
 
-        self.string_data_downloader = MoexStringDataDownloader(FakeDownloader(self.fake_data))
-        self.history_download_params = MoexSecurityHistoryDownloadParameters(board=self.board, sec_id='SECID', start=0)
+        cls.history_download_params = MoexSecurityHistoryDownloadParameters(board=cls.board, sec_id='SECID', start=0)
+
+    @functools.cached_property
+    def string_data_downloader(self):
+        # built only by tests that really use it
+        return MoexStringDataDownloader(FakeDownloader(self.fake_data))
 
     def test_paginate_download_instrument_history_parameters_Success(self):
         params = MoexSecurityHistoryDownloadParameters(self.board, sec_id='SEC ID', start=0)
@@ -260,38 +277,43 @@ class TestMoexStringDataDownloader(unittest.TestCase):
 
 class TestMoexApiActualityChecker(unittest.TestCase):
 
-    def setUp(self):
-        self.engine = TradeEngine(
+    @classmethod
+    def setUpClass(cls):
+        # immutable fixtures are shared between all tests
+        cls.engine = TradeEngine(
             identity=42,
             name=MoexApiActualityChecker._trade_engine_name_to_test,
             title='Фондовый рынок и рынок депозитов')
-        self.market = Market(
+        cls.market = Market(
             identity=42,
-            trade_engine=self.engine,
+            trade_engine=cls.engine,
             name=MoexApiActualityChecker._market_name_to_test,
             title='Рынок акций',
             marketplace='MXSE')
-        self.board = Board(
+        cls.board = Board(
             identity=42,
-            trade_engine=self.engine,
-            market=self.market,
+            trade_engine=cls.engine,
+            market=cls.market,
             boardid=MoexApiActualityChecker._boardid_to_test,
             title='Т+: ETF - безадрес.',
             is_traded=True,
             has_candles=True,
             is_primary=True)
-        self.global_index_data = GlobalIndexData(
-            trade_engines=(self.engine,),
-            markets=(self.market,),
-            boards=(self.board,))
-
-        self.success_info_data = [SecurityInfo(
+        cls.base_global_index_data = GlobalIndexData(
+            trade_engines=(cls.engine,),
+            markets=(cls.market,),
+            boards=(cls.board,))
+        cls.success_info_data = (SecurityInfo(
             sec_id='SEC ID',
-            board=self.board,
-            short_name='SHORT NAME')
-        ]
+            board=cls.board,
+            short_name='SHORT NAME'),
+        )
+
+    def setUp(self):
+        self.global_index_data = self.base_global_index_data
         self.index_info_parser = FakeMoexSecurityInfoJsonParser(self.success_info_data)
 
+        # history data are mutated by some tests
         self.success_history_data = [SecurityValue(
             trade_date=MoexApiActualityChecker._history_date_to_test,
             close=MoexApiActualityChecker._expected_close_value)
@@ -16,6 +16,24 @@ from sane_finances.sources.moex.v1_3.meta import (
 from .common import CommonTestCases
 from .fakes import FakeMoexDownloadParameterValuesStorage
 
+# immutable fixtures shared by all tests of the module
+_ENGINE = TradeEngine(identity=42, name='NAME', title='TITLE')
+_MARKET = Market(
+    identity=42,
+    trade_engine=_ENGINE,
+    name='NAME',
+    title='TITLE',
+    marketplace='MARKETPLACE')
+_BOARD = Board(
+    identity=42,
+    trade_engine=_ENGINE,
+    market=_MARKET,
+    boardid='BOARDID',
+    title='TITLE',
+    is_traded=True,
+    has_candles=True,
+    is_primary=True)
+
 
 class TestTradeEngine(unittest.TestCase):
 
@@ -28,7 +46,7 @@ class TestMarket(unittest.TestCase):
     def test_safe_create_Success(self):
         _ = Market.safe_create(
             identity=42,
-            trade_engine=TradeEngine(identity=42, name='NAME', title='TITLE'),
+            trade_engine=_ENGINE,
             name='NAME',
             title='TITLE',
             marketplace='MARKETPLACE')
@@ -46,20 +64,11 @@ class TestMarket(unittest.TestCase):
 
 class TestBoard(unittest.TestCase):
 
-    def setUp(self) -> None:
-        self.engine = TradeEngine(identity=42, name='NAME', title='TITLE')
-        self.market = Market(
-            identity=42,
-            trade_engine=self.engine,
-            name='NAME',
-            title='TITLE',
-            marketplace='MARKETPLACE')
-
     def test_safe_create_Success(self):
         _ = Board.safe_create(
             identity=42,
-            trade_engine=self.engine,
-            market=self.market,
+            trade_engine=_ENGINE,
+            market=_MARKET,
             boardid='BOARDID',
             title='TITLE',
             is_traded=True,
@@ -72,7 +81,7 @@ class TestBoard(unittest.TestCase):
             _ = Board.safe_create(
                 identity=42,
                 trade_engine=None,
-                market=self.market,
+                market=_MARKET,
                 boardid='BOARDID',
                 title='TITLE',
                 is_traded=True,
@@ -84,7 +93,7 @@ class TestBoard(unittest.TestCase):
             # noinspection PyTypeChecker
             _ = Board.safe_create(
                 identity=42,
-                trade_engine=self.engine,
+                trade_engine=_ENGINE,
                 market=None,
                 boardid='BOARDID',
                 title='TITLE',
@@ -120,27 +129,9 @@ class TestSecurityValue(unittest.TestCase):
 class TestSecurityInfo(unittest.TestCase):
 
     def test_instrument_value_Success(self):
-        engine = TradeEngine(identity=42, name='NAME', title='TITLE')
-        market = Market(
-            identity=42,
-            trade_engine=engine,
-            name='NAME',
-            title='TITLE',
-            marketplace='MARKETPLACE')
-
-        board = Board.safe_create(
-            identity=42,
-            trade_engine=engine,
-            market=market,
-            boardid='BOARDID',
-            title='TITLE',
-            is_traded=True,
-            has_candles=True,
-            is_primary=True)
-
         security_info = SecurityInfo(
             sec_id='ID',
-            board=board,
+            board=_BOARD,
             short_name='SHORT NAME')
         expected_instrument_info = InstrumentInfo(code=security_info.sec_id, name=security_info.short_name)
 
@@ -160,25 +151,7 @@ class TestSecurityInfo(unittest.TestCase):
 class TestMoexSecuritiesInfoDownloadParameters(unittest.TestCase):
 
     def test_safe_create_Success(self):
-        engine = TradeEngine(identity=42, name='NAME', title='TITLE')
-        market = Market(
-            identity=42,
-            trade_engine=engine,
-            name='NAME',
-            title='TITLE',
-            marketplace='MARKETPLACE')
-
-        board = Board.safe_create(
-            identity=42,
-            trade_engine=engine,
-            market=market,
-            boardid='BOARDID',
-            title='TITLE',
-            is_traded=True,
-            has_candles=True,
-            is_primary=True)
-
-        _ = MoexSecuritiesInfoDownloadParameters.safe_create(board=board)
+        _ = MoexSecuritiesInfoDownloadParameters.safe_create(board=_BOARD)
 
     def test_safe_create_raiseWrongBoard(self):
         with self.assertRaises(TypeError):
@@ -188,28 +161,9 @@ class TestMoexSecuritiesInfoDownloadParameters(unittest.TestCase):
 
 class TestMoexSecurityHistoryDownloadParameters(unittest.TestCase):
 
-    def setUp(self) -> None:
-        engine = TradeEngine(identity=42, name='NAME', title='TITLE')
-        market = Market(
-            identity=42,
-            trade_engine=engine,
-            name='NAME',
-            title='TITLE',
-            marketplace='MARKETPLACE')
-
-        self.board = Board.safe_create(
-            identity=42,
-            trade_engine=engine,
-            market=market,
-            boardid='BOARDID',
-            title='TITLE',
-            is_traded=True,
-            has_candles=True,
-            is_primary=True)
-
     def test_safe_create_Success(self):
         _ = MoexSecurityHistoryDownloadParameters.safe_create(
-            board=self.board,
+            board=_BOARD,
             sec_id='ID',
             start=0)
 
@@ -223,7 +177,7 @@ class TestMoexSecurityHistoryDownloadParameters(unittest.TestCase):
 
     def test_clone_with_instrument_info_parameters_Success(self):
         params = MoexSecurityHistoryDownloadParameters.safe_create(
-            board=self.board,
+            board=_BOARD,
             sec_id='ID',
             start=0)
         expected_result = params
@@ -3,7 +3,10 @@
 
 import datetime
 import decimal
+import functools
+import json
 import re
+import typing
 import unittest
 
 from sane_finances.sources.base import ParseError, InstrumentValuesHistoryEmpty
@@ -15,224 +18,157 @@ from sane_finances.sources.moex.v1_3.parsers import (
 from .fakes import FakeMoexDownloadParameterValuesStorage
 
 
-class TestMoexHistoryJsonParser(unittest.TestCase):
-
-    def setUp(self):
-        self.parser = MoexHistoryJsonParser()
-
-        self.expected_close_str = '12345.6789'
-        self.expected_result = [SecurityValue(
-            trade_date=datetime.date(2000, 12, 31),
-            close=decimal.Decimal(self.expected_close_str))]
-
-        self.expected_date_str = self.expected_result[0].trade_date.strftime(self.parser.trade_date_format)
-
-    def test_parse_SuccessWithClose(self):
-        valid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
-        result = list(self.parser.parse(valid_json, tzinfo=None))
-
-        self.assertSequenceEqual(result, self.expected_result)
-
-    def test_parse_AcceptNulls(self):
-        expected_result = []
-        valid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", null]]
-        }}}}"""
-        result = list(self.parser.parse(valid_json, tzinfo=None))
-
-        self.assertSequenceEqual(result, expected_result)
-
-    def test_parse_SuccessWithLegalClosePrice(self):
-        valid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
-        result = list(self.parser.parse(valid_json, tzinfo=None))
-
-        self.assertSequenceEqual(result, self.expected_result)
-
-    def test_parse_SuccessBonds(self):
-        face_value = decimal.Decimal(1000)
-        self.expected_result[0].close *= face_value / 100
-        valid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE", "FACEVALUE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}, {face_value}]]
-        }}}}"""
-        result = list(self.parser.parse(valid_json, tzinfo=None))
-
-        self.assertSequenceEqual(result, self.expected_result)
-
-    def test_parse_AcceptNullFaceValue(self):
-        valid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE", "FACEVALUE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}, null]]
-        }}}}"""
-        result = list(self.parser.parse(valid_json, tzinfo=None))
-
-        self.assertSequenceEqual(result, self.expected_result)
-
-    def test_parse_raisesWhenNoCloseColumns(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD"]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenWrongDate(self):
-        # wrong format
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID"],
-            "data": [["TQBR", "9999-9999-9999", "ABRD"]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-        # wrong type
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID"],
-            "data": [["TQBR", 42, "ABRD"]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenWrongCloseValue(self):
-        # wrong format
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", "123.123.123"]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenNoRequiredColumn(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE__", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenNoColumnInData(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD"]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenNoColumnsBlock(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns__": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenWrongColumnsType(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": 42,
-            "data": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
+@functools.lru_cache(maxsize=8)
+def _get_spoil_pattern(block_name: str) -> typing.Pattern:
+    return re.compile(
+        fr'"{re.escape(block_name)}"\s*:\s*{{(.*?)"data"\s*:\s*.*?}}',
+        re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+
+_EXPECTED_DATE = datetime.date(2000, 12, 31)
+_EXPECTED_DATE_STR = _EXPECTED_DATE.strftime(MoexHistoryJsonParser.trade_date_format)
+_EXPECTED_CLOSE_STR = '12345.6789'
+_EXPECTED_CLOSE_VALUE = decimal.Decimal(_EXPECTED_CLOSE_STR)
+# tuple to prevent accidental modification of shared expected result
+_EXPECTED_HISTORY_RESULT = (SecurityValue(trade_date=_EXPECTED_DATE, close=_EXPECTED_CLOSE_VALUE),)
+
+
+def _make_history_json(columns: typing.Any, data: typing.Any, columns_key='columns', data_key='data') -> str:
+    return json.dumps({'history': {columns_key: columns, data_key: data}})
+
+
+_HISTORY_COLUMNS = ["BOARDID", "TRADEDATE", "SECID", "CLOSE"]
+_EXPECTED_CLOSE = float(_EXPECTED_CLOSE_STR)
+_FACE_VALUE = 1000
+# payloads are serialized once at import time
+_SUCCESS_HISTORY_CASES = (
+    ('WithClose',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]]),
+     _EXPECTED_HISTORY_RESULT),
+    ('WithSameDates',
+     _make_history_json(
+         _HISTORY_COLUMNS,
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE],
+          ["TQTF", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]]),
+     _EXPECTED_HISTORY_RESULT * 2),
+    ('AcceptNulls',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", _EXPECTED_DATE_STR, "ABRD", None]]),
+     ()),
+    ('WithLegalClosePrice',
+     _make_history_json(
+         ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE"],
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]]),
+     _EXPECTED_HISTORY_RESULT),
+    ('Bonds',
+     _make_history_json(
+         ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE", "FACEVALUE"],
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE, _FACE_VALUE]]),
+     (SecurityValue(trade_date=_EXPECTED_DATE, close=_EXPECTED_CLOSE_VALUE * _FACE_VALUE / 100),)),
+    ('AcceptNullFaceValue',
+     _make_history_json(
+         ["BOARDID", "TRADEDATE", "SECID", "LEGALCLOSEPRICE", "FACEVALUE"],
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE, None]]),
+     _EXPECTED_HISTORY_RESULT),
+)
+# (case ID, JSON, expected exception, expected message regex, whether raises eagerly, i.e. without iteration)
+_INVALID_HISTORY_CASES = (
+    ('NoCloseColumns',
+     _make_history_json(["BOARDID", "TRADEDATE", "SECID"], [["TQBR", _EXPECTED_DATE_STR, "ABRD"]]),
+     ParseError, "Neither 'LEGALCLOSEPRICE' nor 'CLOSE'", True),
+    ('WrongDateFormat',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", "9999-9999-9999", "ABRD", _EXPECTED_CLOSE]]),
+     ParseError, "Can't convert '9999-9999-9999' to date", False),
+    ('WrongDateType',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", 42, "ABRD", _EXPECTED_CLOSE]]),
+     ParseError, "Can't convert 42 to date", False),
+    ('WrongCloseValue',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", _EXPECTED_DATE_STR, "ABRD", "123.123.123"]]),
+     ParseError, "Can't convert '123.123.123' to decimal", False),
+    ('NoRequiredColumn',
+     _make_history_json(
+         ["BOARDID", "TRADEDATE__", "SECID", "CLOSE"],
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]]),
+     ParseError, None, True),
+    ('NoColumnInData',
+     _make_history_json(_HISTORY_COLUMNS, [["TQBR", _EXPECTED_DATE_STR, "ABRD"]]),
+     ParseError, None, False),
+    ('NoColumnsBlock',
+     _make_history_json(
+         _HISTORY_COLUMNS,
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]],
+         columns_key='columns__'),
+     ParseError, None, True),
+    ('WrongColumnsType',
+     _make_history_json(42, [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]]),
+     ParseError, None, True),
+    ('NoDataBlock',
+     _make_history_json(
+         _HISTORY_COLUMNS,
+         [["TQBR", _EXPECTED_DATE_STR, "ABRD", _EXPECTED_CLOSE]],
+         data_key='data__'),
+     ParseError, None, True),
+    ('WrongDataType',
+     _make_history_json(_HISTORY_COLUMNS, 42),
+     ParseError, None, True),
+    ('EmptyHistory',
+     _make_history_json(_HISTORY_COLUMNS, []),
+     InstrumentValuesHistoryEmpty, None, True),
+    ('EmptyString', '', ParseError, None, True),
+    ('WrongJson', '[]', ParseError, None, True),
+    ('UnknownJson', '{}', ParseError, None, True),
+)
 
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
 
-    def test_parse_raisesWhenNoDataBlock(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data__": [["TQBR", "{self.expected_date_str}", "ABRD", {self.expected_close_str}]]
-        }}}}"""
-
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
-
-    def test_parse_raisesWhenWrongDataType(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": 42
-        }}}}"""
+class TestMoexHistoryJsonParser(unittest.TestCase):
 
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
+    @classmethod
+    def setUpClass(cls):
+        # parser keeps no state between parse calls, so it's shared by all tests
+        cls.parser = MoexHistoryJsonParser()
 
-    def test_parse_raisesWhenEmptyHistory(self):
-        invalid_json = f"""
-        {{
-        "history": {{
-            "columns": ["BOARDID", "TRADEDATE", "SECID", "CLOSE"],
-            "data": []
-        }}}}"""
+    def test_parse_Success(self):
+        for case_id, valid_json, expected_result in _SUCCESS_HISTORY_CASES:
+            with self.subTest(case_id):
+                result = list(self.parser.parse(valid_json, tzinfo=None))
 
-        with self.assertRaises(InstrumentValuesHistoryEmpty):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
+                self.assertSequenceEqual(result, expected_result)
 
-    def test_parse_raisesWhenEmptyString(self):
-        invalid_json = ''
+    def test_parse_raisesWhenInvalid(self):
+        for case_id, invalid_json, expected_exception, expected_regex, _ in _INVALID_HISTORY_CASES:
+            with self.subTest(case_id):
+                with self.assertRaisesRegex(expected_exception, re.escape(expected_regex or '')):
+                    _ = list(self.parser.parse(invalid_json, tzinfo=None))
 
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
+    def test_parse_raisesEagerlyWhenWrongStructure(self):
+        for case_id, invalid_json, expected_exception, _, is_eager in _INVALID_HISTORY_CASES:
+            if not is_eager:
+                continue
 
-    def test_parse_raisesWhenWrongJson(self):
-        invalid_json = """[]"""
+            with self.subTest(case_id):
+                with self.assertRaises(expected_exception):
+                    # no iteration here
+                    _ = self.parser.parse(invalid_json, tzinfo=None)
 
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
+    def test_parse_raisesLazilyWhenWrongData(self):
+        for case_id, invalid_json, expected_exception, _, is_eager in _INVALID_HISTORY_CASES:
+            if is_eager:
+                continue
 
-    def test_parse_raisesWhenUnknownJson(self):
-        invalid_json = """{}"""
+            with self.subTest(case_id):
+                # structure is valid, hence no error until iteration
+                values = self.parser.parse(invalid_json, tzinfo=None)
 
-        with self.assertRaises(ParseError):
-            _ = list(self.parser.parse(invalid_json, tzinfo=None))
+                with self.assertRaises(expected_exception):
+                    _ = list(values)
 
 
 class TestMoexSecurityInfoJsonParser(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         engine = TradeEngine(identity=42, name='NAME', title='TITLE')
         market = Market(identity=42, trade_engine=engine, name='NAME', title='TITLE', marketplace='MARKETPLACE')
-        self.board = Board(
+        cls.board = Board(
             identity=42,
             trade_engine=engine,
             market=market,
@@ -241,12 +177,13 @@ class TestMoexSecurityInfoJsonParser(unittest.TestCase):
             is_traded=True,
             has_candles=True,
             is_primary=True)
-        global_index_data = GlobalIndexData(
+        cls.global_index_data = GlobalIndexData(
             trade_engines=(engine,),
             markets=(market,),
-            boards=(self.board,),
+            boards=(cls.board,),
         )
-        self.parser = MoexSecurityInfoJsonParser(FakeMoexDownloadParameterValuesStorage(global_index_data))
+        # parser rebuilds its boards lookup on each parse, so it's shared by all tests
+        cls.parser = MoexSecurityInfoJsonParser(FakeMoexDownloadParameterValuesStorage(cls.global_index_data))
 
     def test_parse_SuccessAllColumns(self):
         sec_info = SecurityInfo(
@@ -260,7 +197,7 @@ class TestMoexSecurityInfoJsonParser(unittest.TestCase):
             reg_number='REGNUMBER')
         expected_result = [sec_info]
 
-        json = f"""{{
+        json_text = f"""{{
             "securities": {{
                 "columns": ["SECID", "BOARDID", "SHORTNAME", "LOTSIZE", "SECNAME", "NAME", "ISIN", "LATNAME",
                             "REGNUMBER"],
@@ -269,7 +206,7 @@ class TestMoexSecurityInfoJsonParser(unittest.TestCase):
                            "{sec_info.lat_name}", "{sec_info.reg_number}"]]
             }}}}"""
 
-        result = list(self.parser.parse(json))
+        result = list(self.parser.parse(json_text))
 
         self.assertSequenceEqual(result, expected_result)
 
@@ -280,28 +217,26 @@ class TestMoexSecurityInfoJsonParser(unittest.TestCase):
             short_name='SHORT NAME')
         expected_result = [sec_info]
 
-        json = f"""{{
+        json_text = f"""{{
             "securities": {{
                 "columns": ["SECID", "BOARDID", "SHORTNAME"],
                 "data": [["{sec_info.sec_id}", "{sec_info.board.boardid}", "{sec_info.short_name}"]]
             }}}}"""
 
-        result = list(self.parser.parse(json))
+        result = list(self.parser.parse(json_text))
 
         self.assertSequenceEqual(result, expected_result)
 
     def test_parse_SuccessEmptyList(self):
-        expected_result = []
-
-        json = """{
+        json_text = """{
             "securities": {
                 "columns": ["SECID", "BOARDID", "SHORTNAME"],
                 "data": []
             }}"""
 
-        result = list(self.parser.parse(json))
+        result = list(self.parser.parse(json_text))
 
-        self.assertSequenceEqual(result, expected_result)
+        self.assertEqual(result, [])
 
     def test_parse_raisesWrongBoard(self):
         sec_info = SecurityInfo(
@@ -332,34 +267,37 @@ class TestMoexSecurityInfoJsonParser(unittest.TestCase):
 
 class TestMoexGlobalIndexJsonParser(unittest.TestCase):
 
-    def setUp(self):
-        self.engine = TradeEngine(
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = TradeEngine(
             identity=1,
             name='stock',
             title='Фондовый рынок и рынок депозитов')
-        self.market = Market(
+        cls.market = Market(
             identity=1,
-            trade_engine=self.engine,
+            trade_engine=cls.engine,
             name='shares',
             title='Рынок акций',
             marketplace='MXSE')
-        self.board = Board(
+        cls.board = Board(
             identity=178,
-            trade_engine=self.engine,
-            market=self.market,
+            trade_engine=cls.engine,
+            market=cls.market,
             boardid='TQTF',
             title='Т+: ETF - безадрес.',
             is_traded=True,
             has_candles=True,
             is_primary=True)
-        self.expected_result = GlobalIndexData(
-            trade_engines=(self.engine,),
-            markets=(self.market,),
-            boards=(self.board,))
-
-        self.parser = MoexGlobalIndexJsonParser()
-
-    def generate_valid_json(self):
+        cls.expected_result = GlobalIndexData(
+            trade_engines=(cls.engine,),
+            markets=(cls.market,),
+            boards=(cls.board,))
+        cls.valid_json = cls.generate_valid_json()
+        # parser keeps no state between parse calls, so it's shared by all tests
+        cls.parser = MoexGlobalIndexJsonParser()
+
+    @classmethod
+    def generate_valid_json(cls):
         valid_json = f"""
         {{
         "engines": {{
@@ -369,7 +307,7 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
                 "title": {{"type": "string", "bytes": 765, "max_size": 0}}
             }},
             "columns": ["id", "name", "title"], 
-            "data": [[{self.engine.identity}, "{self.engine.name}", "{self.engine.title}"]]
+            "data": [[{cls.engine.identity}, "{cls.engine.name}", "{cls.engine.title}"]]
         }},
         "markets": {{
             "metadata": {{
@@ -384,8 +322,8 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
             }},
             "columns": ["id", "trade_engine_id", "trade_engine_name", "trade_engine_title", "market_name", 
                         "market_title", "market_id", "marketplace"], 
-            "data": [[{self.market.identity}, {self.engine.identity}, "{self.engine.name}", "{self.engine.title}",
-                      "{self.market.name}", "{self.market.title}", {self.market.identity}, "{self.market.marketplace}"]]
+            "data": [[{cls.market.identity}, {cls.engine.identity}, "{cls.engine.name}", "{cls.engine.title}",
+                      "{cls.market.name}", "{cls.market.title}", {cls.market.identity}, "{cls.market.marketplace}"]]
         }},
         "boards": {{
             "metadata": {{
@@ -401,23 +339,22 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
             }},
             "columns": ["id", "board_group_id", "engine_id", "market_id", "boardid", "board_title", "is_traded",
                         "has_candles", "is_primary"], 
-            "data": [[{self.board.identity}, 57, {self.engine.identity}, {self.market.identity},
-                      "{self.board.boardid}", "{self.board.title}",
-                      {1 if self.board.is_traded else 0}, {1 if self.board.has_candles else 0}, 
-                      {1 if self.board.is_primary else 0}]]
+            "data": [[{cls.board.identity}, 57, {cls.engine.identity}, {cls.market.identity},
+                      "{cls.board.boardid}", "{cls.board.title}",
+                      {1 if cls.board.is_traded else 0}, {1 if cls.board.has_candles else 0}, 
+                      {1 if cls.board.is_primary else 0}]]
         }}
         }}"""
 
         return valid_json
 
     def spoil_block_data(self, block_name: str, new_data_content: str):
-        spoil_pattern = re.compile(
-            fr'"{block_name}"\s*:\s*{{(.*?)"data"\s*:\s*.*?}}',
-            re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        return spoil_pattern.sub(fr'"{block_name}":{{\1"data":{new_data_content}}}', self.generate_valid_json())
+        return _get_spoil_pattern(block_name).sub(
+            fr'"{block_name}":{{\1"data":{new_data_content}}}',
+            self.valid_json)
 
     def test_parse_Success(self):
-        result = self.parser.parse(self.generate_valid_json())
+        result = self.parser.parse(self.valid_json)
 
         self.assertEqual(result, self.expected_result)
 
@@ -435,7 +372,7 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
 
     def test_parse_raisesWhenWrongEnginesContent(self):
         # no block
-        wrong_json = self.generate_valid_json().replace(f'"engines"', f'"engines__"')
+        wrong_json = self.valid_json.replace('"engines"', '"engines__"')
 
         with self.assertRaises(ParseError):
             _ = list(self.parser.parse(wrong_json))
@@ -448,7 +385,7 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
 
     def test_parse_raisesWhenWrongMarketsContent(self):
         # no block
-        wrong_json = self.generate_valid_json().replace(f'"markets"', f'"markets__"')
+        wrong_json = self.valid_json.replace('"markets"', '"markets__"')
 
         with self.assertRaises(ParseError):
             _ = list(self.parser.parse(wrong_json))
@@ -470,7 +407,7 @@ class TestMoexGlobalIndexJsonParser(unittest.TestCase):
 
     def test_parse_raisesWhenWrongBoardsContent(self):
         # no block
-        wrong_json = self.generate_valid_json().replace(f'"boards"', f'"boards__"')
+        wrong_json = self.valid_json.replace('"boards"', '"boards__"')
 
         with self.assertRaises(ParseError):
             _ = list(self.parser.parse(wrong_json))
@@ -6,7 +6,7 @@ import typing
 from .common import CommonTestCases
 
 
-class TestYahooV8Register(CommonTestCases.CommonSourceRegisterTests):
+class TestMoexV13Register(CommonTestCases.CommonSourceRegisterTests):
 
     def get_source_instrument_exporter_factory(self) -> typing.Type:
         from sane_finances.sources.moex.v1_3.exporters import MoexIndexExporterFactory_v1_3
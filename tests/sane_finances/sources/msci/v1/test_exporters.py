@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
 import datetime
 import decimal
+import functools
+import os
+import typing
 import unittest
 
 from sane_finances.sources.base import CheckApiActualityError, InstrumentExporterFactory, ParseError
@@ -17,20 +21,38 @@ from .fakes import (
     FakeDownloader, FakeIndexInfoParser, FakeMsciHistoryXmlParser, FakeMsciStringDataDownloader)
 
 
+# contexts are not changed by tests, so one instance is shared
+_DEFAULT_CONTEXT = Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL)
+_WRONG_FIRST_VALUE = decimal.Decimal(-1)
+_FAKE_INFO_STR_DATA = 'info'
+_FAKE_HISTORY_STR_DATA = 'history'
+_ONE_MONTH = datetime.timedelta(days=30)
+_TWO_MONTHS = datetime.timedelta(days=60)
+_ONE_YEAR = datetime.timedelta(days=365)
+_TEN_YEARS = datetime.timedelta(days=365*10)
+# set SANE_TESTS_FAST environment variable to skip redundant variants of heavy cases
+_FAST_MODE = bool(os.getenv('SANE_TESTS_FAST'))
+
+
 class TestMsciStringDataDownloader(unittest.TestCase):
-    
-    def setUp(self):
-        # fake downloaders
-        self.fake_data = 'data'
-        
-        downloader = FakeDownloader(self.fake_data)
-        
-        self.string_data_downloader = MsciStringDataDownloader(downloader)
+
+    @classmethod
+    def setUpClass(cls):
+        # the same "now" for all tests
+        cls.now = datetime.datetime.now()
+
+        # fake downloaders, not changed by tests
+        cls.fake_data = 'data'
+
+        downloader = FakeDownloader(cls.fake_data)
+
+        cls.string_data_downloader = MsciStringDataDownloader(downloader)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def generate_history_download_parameters(date_from: datetime.date, date_to: datetime.date):
         index_id = '100'
-        context = Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL)
+        context = _DEFAULT_CONTEXT
         index_level = IndexLevels.PRICE
         currency = Currencies.USD
         parameters = MsciIndexHistoryDownloadParameters.safe_create(
@@ -45,7 +67,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
     def test_adjust_download_instrument_history_parameters_Success(self):
         moment_from = datetime.datetime(2010, 1, 1)
-        moment_to = moment_from + datetime.timedelta(days=365)
+        moment_to = moment_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         params, moment_from, moment_to = self.string_data_downloader.adjust_download_instrument_history_parameters(
@@ -57,8 +79,8 @@ class TestMsciStringDataDownloader(unittest.TestCase):
         self.assertIsNotNone(params)
 
         # disalign dates with parameters
-        moment_from -= datetime.timedelta(days=30)
-        moment_to += datetime.timedelta(days=30)
+        moment_from -= _ONE_MONTH
+        moment_to += _ONE_MONTH
 
         params, moment_from, moment_to = self.string_data_downloader.adjust_download_instrument_history_parameters(
             parameters=parameters,
@@ -69,8 +91,8 @@ class TestMsciStringDataDownloader(unittest.TestCase):
         self.assertIsNotNone(params)
 
         # disalign dates with parameters
-        moment_from += datetime.timedelta(days=60)
-        moment_to += datetime.timedelta(days=60)
+        moment_from += _TWO_MONTHS
+        moment_to += _TWO_MONTHS
 
         params, moment_from, moment_to = self.string_data_downloader.adjust_download_instrument_history_parameters(
             parameters=parameters,
@@ -83,7 +105,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
     def test_paginate_download_instrument_history_parameters_LongAgoSuccess(self):
         # long ago
         moment_from = datetime.datetime(1955, 1, 1)
-        moment_to = moment_from + datetime.timedelta(days=365)
+        moment_to = moment_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         paginated_parameters_tuples = \
@@ -91,14 +113,13 @@ class TestMsciStringDataDownloader(unittest.TestCase):
                 parameters,
                 moment_from,
                 moment_to)
-        paginated_parameters_tuples = list(paginated_parameters_tuples)  # materialize generator
 
-        self.assertEqual(len(paginated_parameters_tuples), 1)  # don't split
+        self.assertEqual(sum(1 for _ in paginated_parameters_tuples), 1)  # don't split
 
     def test_paginate_download_instrument_history_parameters_TodaySuccess(self):
         # today
-        moment_from = datetime.datetime.now()
-        moment_to = moment_from + datetime.timedelta(days=365)
+        moment_from = self.now
+        moment_to = moment_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         paginated_parameters_tuples = \
@@ -106,47 +127,36 @@ class TestMsciStringDataDownloader(unittest.TestCase):
                 parameters,
                 moment_from,
                 moment_to)
-        paginated_parameters_tuples = list(paginated_parameters_tuples)  # materialize generator
 
-        self.assertEqual(len(paginated_parameters_tuples), 1)  # don't split
+        self.assertEqual(sum(1 for _ in paginated_parameters_tuples), 1)  # don't split
 
     def test_paginate_download_instrument_history_parameters_FiveYearsInsideIntervalSuccess(self):
         # 5 years ago inside interval
-        moment_from = datetime.datetime.now() - datetime.timedelta(days=365*10)
-        moment_to = datetime.datetime.now()
-        parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
-
-        paginated_parameters_tuples = \
-            self.string_data_downloader.paginate_download_instrument_history_parameters(
-                parameters,
-                moment_from,
-                moment_to)
-        paginated_parameters_tuples = list(paginated_parameters_tuples)  # materialize generator
-
-        self.assertEqual(len(paginated_parameters_tuples), 2)  # interval was split
-        (first_params, _, _), (second_params, _, _) = paginated_parameters_tuples
-        self.assertLessEqual(first_params.date_from, first_params.date_to)
-        self.assertLessEqual(second_params.date_from, second_params.date_to)
-
-        # even if parameters was disaligned
+        moment_from = self.now - _TEN_YEARS
+        moment_to = self.now
         long_ago = datetime.date(1945, 1, 1)
-        parameters = self.generate_history_download_parameters(long_ago, long_ago)
+        today = self.now.date()
+        cases = (
+            ('aligned', moment_from.date(), moment_to.date(), False),
+            # even if parameters was disaligned
+            ('long ago', long_ago, long_ago, True),
+            ('today', today, today, True),
+        )
 
-        paginated_parameters_tuples = \
-            self.string_data_downloader.paginate_download_instrument_history_parameters(
-                parameters,
-                moment_from,
-                moment_to)
-        paginated_parameters_tuples = list(paginated_parameters_tuples)  # materialize generator
+        for case_id, date_from, date_to, is_redundant in cases:
+            with self.subTest(case_id):
+                if is_redundant and _FAST_MODE:
+                    self.skipTest('fast mode')
 
-        self.assertEqual(len(paginated_parameters_tuples), 2)  # interval was split
-        (first_params, _, _), (second_params, _, _) = paginated_parameters_tuples
-        self.assertLessEqual(first_params.date_from, first_params.date_to)
-        self.assertLessEqual(second_params.date_from, second_params.date_to)
+                parameters = self.generate_history_download_parameters(date_from, date_to)
 
-        today = datetime.date.today()
-        parameters = self.generate_history_download_parameters(today, today)
+                self._assert_split_in_two(parameters, moment_from, moment_to)
 
+    def _assert_split_in_two(
+            self,
+            parameters: MsciIndexHistoryDownloadParameters,
+            moment_from: datetime.datetime,
+            moment_to: datetime.datetime):
         paginated_parameters_tuples = \
             self.string_data_downloader.paginate_download_instrument_history_parameters(
                 parameters,
@@ -161,7 +171,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
     def test_paginate_download_instrument_history_parameters_OneDayDontSplit(self):
         # one day don't split
-        moment_from = moment_to = datetime.datetime.now()
+        moment_from = moment_to = self.now
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         paginated_parameters_tuples = \
@@ -169,13 +179,12 @@ class TestMsciStringDataDownloader(unittest.TestCase):
                 parameters,
                 moment_from,
                 moment_to)
-        paginated_parameters_tuples = list(paginated_parameters_tuples)  # materialize generator
 
-        self.assertEqual(len(paginated_parameters_tuples), 1)  # exactly one
+        self.assertEqual(sum(1 for _ in paginated_parameters_tuples), 1)  # exactly one
 
     def test_download_index_history_string_Success(self):
         date_from = datetime.date(2010, 1, 1)
-        date_to = date_from + datetime.timedelta(days=365)
+        date_to = date_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(date_from, date_to)
         index_id = parameters.index_id
         context = parameters.context
@@ -194,7 +203,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
     def test_download_instrument_history_string_Success(self):
         moment_from = datetime.datetime(2010, 1, 1)  # no hours
-        moment_to = moment_from + datetime.timedelta(days=365)
+        moment_to = moment_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         result = self.string_data_downloader.download_instrument_history_string(parameters, moment_from, moment_to)
@@ -202,7 +211,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
         self.assertEqual(result.downloaded_string, self.fake_data)
 
         moment_from = datetime.datetime(2010, 1, 1, 12)  # has hours
-        moment_to = moment_from + datetime.timedelta(days=365)
+        moment_to = moment_from + _ONE_YEAR
         parameters = self.generate_history_download_parameters(moment_from.date(), moment_to.date())
 
         result = self.string_data_downloader.download_instrument_history_string(parameters, moment_from, moment_to)
@@ -211,7 +220,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
     def test_download_indexes_info_string_Success(self):
         market = Markets.REGIONAL_ALL_COUNTRY
-        context = Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL)
+        context = _DEFAULT_CONTEXT
         
         result = self.string_data_downloader.download_indexes_info_string(market, context)
         
@@ -219,7 +228,7 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
     def test_download_instruments_info_string_Success(self):
         market = Markets.REGIONAL_ALL_COUNTRY
-        context = Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL)
+        context = _DEFAULT_CONTEXT
         parameters = MsciIndexesInfoDownloadParameters.safe_create(market=market, context=context)
 
         result = self.string_data_downloader.download_instruments_info_string(parameters)
@@ -228,13 +237,11 @@ class TestMsciStringDataDownloader(unittest.TestCase):
 
 
 class TestMsciAPIActualityChecker(unittest.TestCase):
-    
-    def setUp(self):
-        # fakes
-        self.fake_info_str_data = 'info'
-        self.fake_history_str_data = 'history'
-        
-        self.success_history_parsed_item = \
+
+    @classmethod
+    def setUpClass(cls):
+        # template is copied before each test, because tests spoil the item
+        cls.success_history_parsed_item_template = \
             IndexValue(
                 date=MsciApiActualityChecker._expectedFirstDate,
                 value=MsciApiActualityChecker._expectedFirstValue,
@@ -242,36 +249,44 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
                 style=MsciApiActualityChecker._expectedIndexContext.style,
                 size=MsciApiActualityChecker._expectedIndexContext.size
             )
+
+    def setUp(self):
+        # fakes
+        self.success_history_parsed_item = copy.copy(self.success_history_parsed_item_template)
         self.success_info_parsed_item = IndexInfo(index_id='FAKE_ID', name='FAKE_NAME')
         
-        self.fake_string_data_downloader = FakeMsciStringDataDownloader(
-            self.fake_info_str_data,
-            self.fake_history_str_data)
+        self.fake_string_data_downloader = FakeMsciStringDataDownloader(_FAKE_INFO_STR_DATA, _FAKE_HISTORY_STR_DATA)
+
+    def _make_checker(
+            self,
+            history_items: typing.Optional[typing.Iterable[IndexValue]] = None,
+            info_items: typing.Optional[typing.Iterable[IndexInfo]] = None,
+            history_exception: typing.Optional[Exception] = None,
+            info_exception: typing.Optional[Exception] = None) -> MsciApiActualityChecker:
+        history_parser = FakeMsciHistoryXmlParser(
+            [self.success_history_parsed_item] if history_items is None else history_items)
+        history_parser.parse_exception = history_exception
+        info_parser = FakeIndexInfoParser(
+            [self.success_info_parsed_item] if info_items is None else info_items)
+        info_parser.parse_exception = info_exception
+
+        return MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
     
     def test_check_Success(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         checker.check()
 
         # check that there is no incorrectly downloaded strings
-        self.assertGreaterEqual(len(self.fake_string_data_downloader.download_instruments_info_string_results), 1)
-        self.assertFalse(any(result.is_correct is False
-                             for result
-                             in self.fake_string_data_downloader.download_instruments_info_string_results))
-        self.assertGreaterEqual(len(self.fake_string_data_downloader.download_instrument_history_string_results), 1)
-        self.assertFalse(any(result.is_correct is False
-                             for result
-                             in self.fake_string_data_downloader.download_instrument_history_string_results))
+        info_results = self.fake_string_data_downloader.download_instruments_info_string_results
+        self.assertTrue(info_results)
+        self.assertTrue(all(result.is_correct is not False for result in info_results))
+        history_results = self.fake_string_data_downloader.download_instrument_history_string_results
+        self.assertTrue(history_results)
+        self.assertTrue(all(result.is_correct is not False for result in history_results))
 
     def test_check_raisesWhenInfoParseError(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        info_parser.parse_exception = ParseError('Error')
-
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker(info_exception=ParseError('Error'))
 
         with self.assertRaises(Exception):
             checker.check()
@@ -280,11 +295,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         self.assertIs(self.fake_string_data_downloader.download_instruments_info_string_results[-1].is_correct, False)
 
     def test_check_raisesWhenInfoUnknownError(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        info_parser.parse_exception = Exception('Error')
-
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker(info_exception=Exception('Error'))
 
         with self.assertRaises(Exception):
             checker.check()
@@ -293,10 +304,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         self.assertIs(self.fake_string_data_downloader.download_instruments_info_string_results[-1].is_correct, False)
 
     def test_check_raisesWhenNoInfo(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([])  # No data
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker(info_items=[])  # No data
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
@@ -305,11 +313,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         self.assertIs(self.fake_string_data_downloader.download_instruments_info_string_results[-1].is_correct, False)
 
     def test_check_raisesWhenHistoryParseError(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        history_parser.parse_exception = ParseError('Error')
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker(history_exception=ParseError('Error'))
 
         with self.assertRaises(Exception):
             checker.check()
@@ -318,11 +322,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         self.assertIs(self.fake_string_data_downloader.download_instrument_history_string_results[-1].is_correct, False)
 
     def test_check_raisesWhenHistoryUnknownError(self):
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        history_parser.parse_exception = Exception('Error')
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker(history_exception=Exception('Error'))
 
         with self.assertRaises(Exception):
             checker.check()
@@ -334,10 +334,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         # corrupt data
         self.success_history_parsed_item.index_name = 'WRONG'
         
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
@@ -346,10 +343,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         # corrupt data
         self.success_history_parsed_item.size = None
         
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
@@ -358,10 +352,7 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         # corrupt data
         self.success_history_parsed_item.style = None
         
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
@@ -370,22 +361,16 @@ class TestMsciAPIActualityChecker(unittest.TestCase):
         # corrupt data
         self.success_history_parsed_item.date = datetime.date.max
         
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
-        
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
     
     def test_check_raisesWhenWrongFirstValue(self):
         # corrupt data
-        self.success_history_parsed_item.value = decimal.Decimal(-1)
-        
-        history_parser = FakeMsciHistoryXmlParser([self.success_history_parsed_item])
-        info_parser = FakeIndexInfoParser([self.success_info_parsed_item])
+        self.success_history_parsed_item.value = _WRONG_FIRST_VALUE
         
-        checker = MsciApiActualityChecker(self.fake_string_data_downloader, history_parser, info_parser)
+        checker = self._make_checker()
         
         with self.assertRaises(CheckApiActualityError):
             checker.check()
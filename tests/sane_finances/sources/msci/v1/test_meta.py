@@ -16,11 +16,17 @@ from sane_finances.sources.msci.v1.meta import (
 from .common import CommonTestCases
 
 
+# contexts are not changed by tests, so one instance is shared
+_DEFAULT_CONTEXT = Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL)
+_INDEX_VALUE = decimal.Decimal(42)
+
+
 class TestFormats(unittest.TestCase):
 
     def test_get_file_extension_Success(self):
-        for value in Formats:
-            _ = Formats.get_file_extension(value)
+        expected_extensions = {Formats.XML: '.xml', Formats.CSV: '.csv'}
+
+        self.assertEqual({value: Formats.get_file_extension(value) for value in Formats}, expected_extensions)
 
 
 class TestIndexValue(unittest.TestCase):
@@ -28,7 +34,7 @@ class TestIndexValue(unittest.TestCase):
     def test_instrument_value_Success(self):
         index_value = IndexValue(
             date=datetime.date(2000, 12, 31),
-            value=decimal.Decimal(42),
+            value=_INDEX_VALUE,
             index_name='NAME',
             style=Styles.NONE,
             size=Sizes.REGIONAL_STANDARD)
@@ -45,7 +51,7 @@ class TestIndexValue(unittest.TestCase):
             # noinspection PyTypeChecker
             _ = IndexValue(
                 date=None,
-                value=decimal.Decimal(42),
+                value=_INDEX_VALUE,
                 index_name='NAME',
                 style=Styles.NONE,
                 size=Sizes.REGIONAL_STANDARD)
@@ -69,7 +75,7 @@ class TestMsciIndexesInfoDownloadParameters(unittest.TestCase):
     def test_safe_create_Success(self):
         _ = MsciIndexesInfoDownloadParameters.safe_create(
             market=Markets.COUNTRY_DEVELOPED_MARKETS,
-            context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL))
+            context=_DEFAULT_CONTEXT)
 
     def test_safe_create_raiseWrongContext(self):
         with self.assertRaises(TypeError):
@@ -81,65 +87,36 @@ class TestMsciIndexesInfoDownloadParameters(unittest.TestCase):
 
 class TestMsciIndexHistoryDownloadParameters(unittest.TestCase):
 
-    def test_safe_create_Success(self):
-        _ = MsciIndexHistoryDownloadParameters.safe_create(
-            index_id='CODE',
-            context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL),
-            index_level=IndexLevels.PRICE,
-            currency=Currencies.USD,
-            date_from=datetime.date(2000, 12, 31),
-            date_to=datetime.date(2000, 12, 31))
+    _VALID_KWARGS = {
+        'index_id': 'CODE',
+        'context': _DEFAULT_CONTEXT,
+        'index_level': IndexLevels.PRICE,
+        'currency': Currencies.USD,
+        'date_from': datetime.date(2000, 12, 31),
+        'date_to': datetime.date(2000, 12, 31)
+    }
 
-    def test_safe_create_raiseWrongContext(self):
-        with self.assertRaises(TypeError):
-            # noinspection PyTypeChecker
-            _ = MsciIndexHistoryDownloadParameters.safe_create(
-                index_id='CODE',
-                context=None,
-                index_level=IndexLevels.PRICE,
-                currency=Currencies.USD,
-                date_from=datetime.date(2000, 12, 31),
-                date_to=datetime.date(2000, 12, 31))
-
-    def test_safe_create_raiseWrongDateFrom(self):
-        with self.assertRaises(TypeError):
-            # noinspection PyTypeChecker
-            _ = MsciIndexHistoryDownloadParameters.safe_create(
-                index_id='CODE',
-                context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL),
-                index_level=IndexLevels.PRICE,
-                currency=Currencies.USD,
-                date_from=None,
-                date_to=datetime.date(2000, 12, 31))
-
-    def test_safe_create_raiseWrongDateTo(self):
-        with self.assertRaises(TypeError):
-            # noinspection PyTypeChecker
-            _ = MsciIndexHistoryDownloadParameters.safe_create(
-                index_id='CODE',
-                context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL),
-                index_level=IndexLevels.PRICE,
-                currency=Currencies.USD,
-                date_from=datetime.date(2000, 12, 31),
-                date_to=None)
-
-    def test_safe_create_raiseWrongDates(self):
-        date_from = datetime.date(2000, 12, 31)
-        date_to = date_from - datetime.timedelta(days=1)
-
-        with self.assertRaises(ValueError):
-            _ = MsciIndexHistoryDownloadParameters.safe_create(
-                index_id='CODE',
-                context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL),
-                index_level=IndexLevels.PRICE,
-                currency=Currencies.USD,
-                date_from=date_from,
-                date_to=date_to)
+    def test_safe_create_Success(self):
+        _ = MsciIndexHistoryDownloadParameters.safe_create(**self._VALID_KWARGS)
+
+    def test_safe_create_raiseWhenWrongArguments(self):
+        date_from = self._VALID_KWARGS['date_from']
+        cases = (
+            ({'context': None}, TypeError),
+            ({'date_from': None}, TypeError),
+            ({'date_to': None}, TypeError),
+            ({'date_to': date_from - datetime.timedelta(days=1)}, ValueError),  # inverted dates
+        )
+
+        for overridden_kwargs, expected_exception in cases:
+            with self.subTest(overridden_kwargs=overridden_kwargs):
+                with self.assertRaises(expected_exception):
+                    _ = MsciIndexHistoryDownloadParameters.safe_create(**dict(self._VALID_KWARGS, **overridden_kwargs))
 
     def test_clone_with_instrument_info_parameters_Success(self):
         params = MsciIndexHistoryDownloadParameters(
             index_id='CODE',
-            context=Context(style=Styles.NONE, size=Sizes.REGIONAL_STANDARD, scope=Scopes.REGIONAL),
+            context=_DEFAULT_CONTEXT,
             index_level=IndexLevels.PRICE,
             currency=Currencies.USD,
             date_from=datetime.date(2000, 12, 31),
@@ -40,6 +40,22 @@ class TestMsciHistoryXmlParser(unittest.TestCase):
 
         self.assertSequenceEqual(result, expected_result)
 
+    def test_parse_SuccessWithExponentValue(self):
+        parser = MsciHistoryXmlParser()
+
+        valid_xml = """<?xml version="1.0" ?>  <performance>
+          <index id="EAFE,C,36">
+            <asOf>
+              <date>03/11/2016</date>
+              <value>1.644941E3</value>
+            </asOf>
+          </index>
+        </performance>"""
+
+        result = list(parser.parse(valid_xml, tzinfo=None))
+
+        self.assertEqual([item.value for item in result], [decimal.Decimal('1644.941')])
+
     def test_parse_raisesWhenNoData(self):
         parser = MsciHistoryXmlParser()
 
@@ -64,6 +80,20 @@ class TestMsciHistoryXmlParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             list(parser.parse(invalid_xml, tzinfo=None))
 
+    def test_parse_raisesBeforeFirstItemWhenTruncated(self):
+        parser = MsciHistoryXmlParser()
+
+        invalid_xml = """<?xml version="1.0" ?>  <performance>
+          <index id="EAFE,C,36">
+            <asOf>
+              <date>03/11/2016</date>
+              <value>1,644.941</value>
+            </asOf>
+            <asOf>"""
+
+        with self.assertRaises(ParseError):
+            next(iter(parser.parse(invalid_xml, tzinfo=None)))
+
     def test_parse_raisesWhenWrongIndexId(self):
         parser = MsciHistoryXmlParser()
 
@@ -79,6 +109,21 @@ class TestMsciHistoryXmlParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             list(parser.parse(invalid_xml, tzinfo=None))
 
+    def test_parse_raisesWhenIndexIdHasEmptyPart(self):
+        parser = MsciHistoryXmlParser()
+
+        invalid_xml = """<?xml version="1.0" ?>  <performance>
+          <index id="EAFE,,36">
+            <asOf>
+              <date>03/11/2016</date>
+              <value>1,644.941</value>
+            </asOf>
+          </index>
+        </performance>"""
+
+        with self.assertRaises(ParseError):
+            list(parser.parse(invalid_xml, tzinfo=None))
+
     def test_parse_raisesWhenNoDateTag(self):
         parser = MsciHistoryXmlParser()
 
@@ -139,6 +184,23 @@ class TestMsciHistoryXmlParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             list(parser.parse(invalid_xml, tzinfo=None))
 
+    def test_parse_raisesWhenSpecialValue(self):
+        parser = MsciHistoryXmlParser()
+
+        for special_value in ('NaN', 'sNaN', 'Infinity', '-Infinity'):
+            with self.subTest(special_value=special_value):
+                invalid_xml = f"""<?xml version="1.0" ?>  <performance>
+                  <index id="EAFE,C,36">
+                    <asOf>
+                      <date>03/11/2016</date>
+                      <value>{special_value}</value>
+                    </asOf>
+                  </index>
+                </performance>"""
+
+                with self.assertRaises(ParseError):
+                    list(parser.parse(invalid_xml, tzinfo=None))
+
 
 class TestMsciIndexInfoParser(unittest.TestCase):
 
@@ -106,6 +106,24 @@ class TestMsciIndexDownloadParameterValuesStorage(unittest.TestCase):
         value = self.storage.get_dynamic_enum_value_by_key(None, 'ID')
         self.assertIsNone(value)
 
+    def test_get_dynamic_enum_value_by_key_SeesReloadedValues(self):
+        self.assertIsNotNone(self.storage.get_dynamic_enum_value_by_key(Market, 'ID'))
+
+        new_market = Market(identity='NEW_ID', name='NEW_NAME')
+        self.index_panel_data_json_parser.fake_index_panel_data = \
+            self.fake_index_panel_data._replace(markets=(new_market,))
+        self.storage.reload()
+
+        self.assertIsNone(self.storage.get_dynamic_enum_value_by_key(Market, 'ID'))
+        self.assertEqual(self.storage.get_dynamic_enum_value_by_key(Market, 'NEW_ID'), new_market)
+
+    def test_get_dynamic_enum_value_by_key_SeesAssignedIndexPanelData(self):
+        self.assertIsNotNone(self.storage.get_dynamic_enum_value_by_key(Market, 'ID'))
+
+        self.storage.index_panel_data = self.fake_index_panel_data._replace(markets=())
+
+        self.assertIsNone(self.storage.get_dynamic_enum_value_by_key(Market, 'ID'))
+
     def test_get_dynamic_enum_value_by_choice_Success(self):
         all_types = self.storage.get_all_managed_types()
         for dynamic_enum_type in all_types:
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 import datetime
 import decimal
+import sys
 import unittest
 
 from sane_finances.sources.base import (
@@ -23,6 +24,13 @@ class TestMarket(unittest.TestCase):
             # noinspection PyTypeChecker
             _ = Market.safe_create(identity='ID', name='NAME', scope=42)
 
+    def test_safe_create_InternsIdentity(self):
+        identity = ''.join(('I', 'D'))  # built at runtime, so not interned by compiler
+
+        market = Market.safe_create(identity=identity, name='NAME')
+
+        self.assertIs(market.identity, sys.intern('ID'))
+
 
 class TestIndexSuite(unittest.TestCase):
 
@@ -82,11 +82,11 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
             moment_to))
 
         self.assertSequenceEqual(expected_result, history)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 1)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instrument_history_string_results))
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertEqual(self.history_values_parser.parse_counter, 1)
 
     def test_ReturnOnlyAskedInterval(self):
@@ -105,11 +105,11 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
             moment_to))
 
         self.assertSequenceEqual(history, expected_result)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 1)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instrument_history_string_results))
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertEqual(self.history_values_parser.parse_counter, 1)
 
     def test_ReturnOnlyAdjustedInterval(self):
@@ -142,11 +142,11 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
             moment_to))
 
         self.assertSequenceEqual(history, expected_result)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 1)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instrument_history_string_results))
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertEqual(self.history_values_parser.parse_counter, 1)
 
     def test_ReturnCallDownloadAndParseMultipleTimes(self):
@@ -185,11 +185,11 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
         self.assertSequenceEqual(expected_result, history)
         self.assertSequenceEqual(expected_parameters,
                                  self.string_data_downloader.download_instrument_history_string_parameters)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, pages_count)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), pages_count)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instrument_history_string_results))
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertEqual(self.history_values_parser.parse_counter, pages_count)
 
     def test_RaiseWhenPagesLimitExceeded(self):
@@ -270,7 +270,7 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
             moment_to))
 
         self.assertSequenceEqual(history, expected_result)
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instrument_history_string_results))
@@ -288,7 +288,7 @@ class TestGenericInstrumentHistoryValuesExporter(unittest.TestCase):
                 moment_from,
                 moment_to))
 
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 0)
         self.assertGreaterEqual(len(self.string_data_downloader.download_instrument_history_string_results), 1)
         self.assertIs(self.string_data_downloader.download_instrument_history_string_results[-1].is_correct, False)
 
@@ -310,8 +310,8 @@ class TestGenericInstrumentsInfoExporter(unittest.TestCase):
         info_list = list(self.exporter.export_instruments_info(None))
 
         self.assertSequenceEqual(info_list, expected_result)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 0)
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 1)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 1)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instruments_info_string_results))
@@ -339,11 +339,11 @@ class TestGenericInstrumentsInfoExporter(unittest.TestCase):
         self.assertSequenceEqual(expected_result, info_list)
         self.assertSequenceEqual(list(range(1, pages_count + 1)),
                                  self.string_data_downloader.download_instruments_info_string_parameters)
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, pages_count)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), pages_count)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instruments_info_string_results))
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 0)
         self.assertEqual(self.info_parser.parse_counter, pages_count)
 
     def test_RaiseWhenDownloadError(self):
@@ -389,7 +389,7 @@ class TestGenericInstrumentsInfoExporter(unittest.TestCase):
         info_list = list(self.exporter.export_instruments_info(None))
 
         self.assertSequenceEqual(info_list, expected_result)
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 0)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 0)
         self.assertTrue(all(result.is_correct
                             for result
                             in self.string_data_downloader.download_instruments_info_string_results))
@@ -401,8 +401,8 @@ class TestGenericInstrumentsInfoExporter(unittest.TestCase):
         with self.assertRaises(Exception):
             _ = list(self.exporter.export_instruments_info(None))
 
-        self.assertEqual(self.string_data_downloader.download_instrument_history_string_counter, 0)
-        self.assertEqual(self.string_data_downloader.download_instruments_info_string_counter, 1)
+        self.assertEqual(len(self.string_data_downloader.download_instrument_history_string_results), 0)
+        self.assertEqual(len(self.string_data_downloader.download_instruments_info_string_results), 1)
         self.assertGreaterEqual(len(self.string_data_downloader.download_instruments_info_string_results), 1)
         self.assertIs(self.string_data_downloader.download_instruments_info_string_results[-1].is_correct, False)
 